@@ -1,16 +1,67 @@
-"""
-Data models for the Smart Pandoc Debugger.
-"""
+# src/smart_pandoc_debugger/data_model.py
+#
+# This module defines the Pydantic models used to represent the state and
+# data flowing through the Smart Diagnostic Engine (SDE). The primary goal of the
+# SDE is to help users diagnose and fix issues in their Markdown documents that
+# prevent successful compilation to PDF, typically via a LaTeX intermediate.
+#
+# The core model, `DiagnosticJob`, encapsulates the entire state of a diagnostic
+# task, evolving as it passes through different service stages. Other models
+# represent more granular pieces of information like contextual code/log snippets,
+# identified problems ("leads"), proposed solutions ("remedies"), and structured
+# results from specialist tools.
+#
+# Key Principles Reflected in this Model:
+# 1.  Markdown-Centric Fixes: All proposed remedies guide the user to modify
+#     their original Markdown file.
+# 2.  MD-to-TeX Short-Circuit: If the initial conversion from Markdown to TeX fails,
+#     this indicates a likely structural Markdown issue. The diagnostic process
+#     focuses on this first, bypassing deeper TeX analysis until the Markdown
+#     can be successfully converted to TeX.
+# 3.  Actionable Output: The system aims to provide concrete, actionable advice
+#     that helps the user achieve a compilable Markdown document.
+# 4.  Context is Key: Identifying the precise location of an issue (in Markdown,
+#     generated TeX, or logs) is crucial for both automated analysis (by an "Oracle"
+#     service) and for user understanding.
+#
+# `utils/data_model.py` re-exports this module, so both import paths share one
+# set of classes (and pydantic builds each schema once per process).
+# The plain enums and result tuples live in `data_types.py`.
 
-from datetime import datetime
-from typing import Dict, Any, Optional, List, NamedTuple
-from pydantic import BaseModel, Field
+from typing import Dict, Any, Optional, List, Tuple
+from typing_extensions import Annotated  # typing.Annotated needs 3.9; pydantic v2 depends on this
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+import itertools
+import sys
 import uuid
-import pathlib
 from enum import Enum
 import time
 
 
+# Short ids for leads and remedies: a random per-process prefix plus a counter.
+# Leads and remedies built by different Manager processes end up in one job, so
+# the prefix keeps them apart; within a process the counter alone is unique, so
+# no fresh entropy is drawn per object.
+_ID_PREFIX = uuid.uuid4().hex[:6]
+_id_counter = itertools.count()
+
+
+def _short_id(kind: str) -> str:
+    return f"{kind}_{_ID_PREFIX}{next(_id_counter):x}"
+
+
+def _intern_str(value: Any) -> Any:
+    """Intern small-vocabulary strings (document types, service names).
+
+    Every lead decoded from JSON would otherwise carry its own copy of e.g.
+    "tex_compilation_log"; interned, all leads share one object.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+InternedStr = Annotated[str, BeforeValidator(_intern_str)]
+
+
 class StatusEnum(str, Enum):
     PENDING = "pending"
     MINER_PROCESSING = "miner_processing"
@@ -71,7 +122,7 @@ class SourceContextSnippet(BaseModel):
     the location of a potential error. This is used to provide context for
     identified leads and proposed remedies.
     """
-    source_document_type: str = Field(
+    source_document_type: InternedStr = Field(
         ...,
         description="Type of the source document or log from which this snippet originates. "
                     "Examples: 'markdown', 'generated_tex', 'md_to_tex_log', 'tex_compilation_log', 'generated_tex_partial_or_invalid'."
@@ -97,6 +148,12 @@ class SourceContextSnippet(BaseModel):
                     "highlighting why it's relevant or what to look for."
     )
 
+    # Snippets are value objects: nothing edits one after it is built, so freezing
+    # makes them hashable and safe to share between leads and remedies.
+    # (ActionableLead/MarkdownRemedy stay mutable: the Investigator enriches
+    # leads in place, and their list/dict fields could not be hashed anyway.)
+    model_config = ConfigDict(frozen=True)
+
 class ActionableLead(BaseModel):
     """
     Represents a specific issue, problem, or "lead" identified by a diagnostic
@@ -105,10 +162,10 @@ class ActionableLead(BaseModel):
     to the compilation failure and for which a remedy might be proposed.
     """
     lead_id: str = Field(
-        default_factory=lambda: f"lead_{uuid.uuid4().hex[:8]}",
+        default_factory=lambda: _short_id("lead"),
         description="A unique identifier for this specific lead."
     )
-    source_service: str = Field( 
+    source_service: InternedStr = Field( 
         ...,
         description="The name of the SDE Manager that identified or is reporting this lead. "
                     "Examples: 'Miner', 'Investigator', 'Oracle'. "
@@ -146,14 +203,14 @@ class MarkdownRemedy(BaseModel):
     and help make the Markdown document successfully compilable to PDF.
     """
     remedy_id: str = Field(
-        default_factory=lambda: f"remedy_{uuid.uuid4().hex[:8]}",
+        default_factory=lambda: _short_id("remedy"),
         description="A unique identifier for this specific remedy."
     )
     applies_to_lead_id: str = Field(
         ...,
         description="The lead_id of the ActionableLead that this remedy is intended to address."
     )
-    source_service: str = Field( # Typically "Oracle"
+    source_service: InternedStr = Field( # Typically "Oracle"
         ...,
         description="The name of the SDE Manager that proposed this remedy."
     )
@@ -190,32 +247,9 @@ class MarkdownRemedy(BaseModel):
         description="Optional notes about this remedy"
     )
 
-# --- Enums for Job State ---
-
-class PipelineStatus(str, Enum):
-    """
-    Represents the state of the pipeline, determining the next action.
-    """
-    READY_FOR_MINER = "Ready for Miner"
-    MINER_FAILURE_PANDOC = "Miner Failure: Pandoc could not convert Markdown to TeX"
-    MINER_SUCCESS_GATHERED_TEX_LOGS = "Miner Success: TeX compilation failed as expected, logs gathered"
-    ORACLE_ANALYSIS_COMPLETE = "Oracle Analysis Complete"
-    REPORTER_SUMMARY_COMPLETE = "Reporter Summary Complete"
-
-# --- Data Structures for Specialist Results ---
-
-PandocConversionResult = NamedTuple("PandocConversionResult", [
-    ("conversion_successful", bool),
-    ("output_tex_file_path", Optional[pathlib.Path]),
-    ("generated_tex_content", Optional[str]),
-    ("pandoc_raw_log", Optional[str])
-])
-
-TexCompilationResult = NamedTuple("TexCompilationResult", [
-    ("compilation_successful", bool),
-    ("pdf_file_path", Optional[pathlib.Path]),
-    ("tex_compiler_raw_log", Optional[str])
-])
+# --- Job State & Specialist Results ---
+# Defined in the pydantic-free `data_types` module and re-exported here.
+from .data_types import PipelineStatus, PandocConversionResult, TexCompilationResult  # noqa: F401
 
 # --- Main Job State Model ---
 
@@ -248,11 +282,30 @@ class DiagnosticJob(BaseModel):
 
     # --- Internal Metadata ---
     timestamp: float = Field(default_factory=time.time)
-    history: List[str] = Field(default_factory=list)
+    history: List[Tuple[float, str]] = Field(default_factory=list)  # (time.time(), message)
+
+    # Assignments are validated so a Manager setting a bad status or path crashes
+    # at the assignment, not in the next stage. This only costs a single-field
+    # check per `job.x = ...`; `log_message` appends in place and never revalidates.
+    model_config = ConfigDict(validate_assignment=True)
 
     def log_message(self, message: str):
-        """Appends a timestamped message to the job's history log."""
-        self.history.append(f"{time.time()}: {message}")
+        """Appends a `(timestamp, message)` entry to the job's history log.
+
+        The timestamp is kept as a float; format it only when the history is shown.
+        """
+        self.history.append((time.time(), message))
 
-    class Config:
-        validate_assignment = True
+
+# --- Pipeline IPC ---
+
+def serialize_job(job: DiagnosticJob, indent: Optional[int] = None) -> bytes:
+    """
+    Encodes a job as UTF-8 JSON bytes for a pipeline stage boundary.
+
+    Uses pydantic-core's prebuilt serializer directly: `model_dump_json()` would
+    produce the same bytes, then decode them to `str` for the caller to
+    re-encode. Decode the other side with `DiagnosticJob.model_validate_json`,
+    which accepts the bytes as-is.
+    """
+    return job.__pydantic_serializer__.to_json(job, indent=indent)
@@ -0,0 +1,45 @@
+# src/smart_pandoc_debugger/data_types.py
+#
+# Plain data structures shared across the SDE: the pipeline state enum and
+# the result tuples returned by the Miner's specialists.
+#
+# This module is standard-library only. Specialists and tools that need just
+# these types import them from here and never pay for pydantic or for the
+# schema build of the models in `data_model.py`, which re-exports everything
+# defined here.
+
+"""
+Lightweight (pydantic-free) data types for the Smart Pandoc Debugger.
+"""
+
+import pathlib
+from enum import Enum
+from typing import NamedTuple, Optional
+
+
+# --- Enums for Job State ---
+
+class PipelineStatus(str, Enum):
+    """
+    Represents the state of the pipeline, determining the next action.
+    """
+    READY_FOR_MINER = "Ready for Miner"
+    MINER_FAILURE_PANDOC = "Miner Failure: Pandoc could not convert Markdown to TeX"
+    MINER_SUCCESS_GATHERED_TEX_LOGS = "Miner Success: TeX compilation failed as expected, logs gathered"
+    ORACLE_ANALYSIS_COMPLETE = "Oracle Analysis Complete"
+    REPORTER_SUMMARY_COMPLETE = "Reporter Summary Complete"
+
+# --- Data Structures for Specialist Results ---
+
+PandocConversionResult = NamedTuple("PandocConversionResult", [
+    ("conversion_successful", bool),
+    ("output_tex_file_path", Optional[pathlib.Path]),
+    ("generated_tex_content", Optional[str]),
+    ("pandoc_raw_log", Optional[str])
+])
+
+TexCompilationResult = NamedTuple("TexCompilationResult", [
+    ("compilation_successful", bool),
+    ("pdf_file_path", Optional[pathlib.Path]),
+    ("tex_compiler_raw_log", Optional[str])
+])
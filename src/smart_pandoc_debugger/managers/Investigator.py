@@ -47,7 +47,7 @@ from typing import List, Optional
 # This script assumes it is run in an environment where 'utils' is on the PYTHONPATH.
 # The project's top-level runner should handle this.
 try:
-    from utils.data_model import DiagnosticJob, ActionableLead, SourceContextSnippet
+    from utils.data_model import DiagnosticJob, ActionableLead, SourceContextSnippet, serialize_job
 except ModuleNotFoundError:
     # Add project root to path for standalone script execution
     current_script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -55,7 +55,7 @@ except ModuleNotFoundError:
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
     try:
-        from utils.data_model import DiagnosticJob, ActionableLead, SourceContextSnippet
+        from utils.data_model import DiagnosticJob, ActionableLead, SourceContextSnippet, serialize_job
     except ModuleNotFoundError as e_inner:
         print(f"CRITICAL INVESTIGATOR ERROR: Failed to import SDE utilities after path correction. Error: {e_inner}", file=sys.stderr)
         sys.exit(1)
@@ -247,10 +247,11 @@ if __name__ == "__main__":
 
     assert args.process_job, "Investigator.py: Must be called with --process-job flag."
     
-    input_json_str = sys.stdin.read()
-    assert input_json_str.strip(), "Investigator.py: Received empty or whitespace-only input from stdin."
+    # Raw bytes straight into pydantic-core's JSON parser; no str decode.
+    input_json_bytes = sys.stdin.buffer.read()
+    assert input_json_bytes.strip(), "Investigator.py: Received empty or whitespace-only input from stdin."
         
-    diagnostic_job_model_input = DiagnosticJob.model_validate_json(input_json_str) 
+    diagnostic_job_model_input = DiagnosticJob.model_validate_json(input_json_bytes) 
     
     case_id_main = getattr(diagnostic_job_model_input, 'case_id', 'unknown_case_in_main')
     logger.info(f"[{case_id_main}] Investigator (__main__): --process-job received, starting logic.")
@@ -266,19 +267,22 @@ if __name__ == "__main__":
         final_dj_state_for_output.final_job_outcome = f"InvestigatorCrashed_{type(e_crash).__name__}"
         final_dj_state_for_output.current_pipeline_stage = "Investigator_Crashed_CaughtInMain"
         
-        output_json_str = final_dj_state_for_output.model_dump_json(
+        output_json_bytes = serialize_job(
+            final_dj_state_for_output,
             indent=2 if os.environ.get("SDE_PRETTY_PRINT_JSON", "false").lower() == "true" else None
         )
-        sys.stdout.write(output_json_str)
-        sys.stdout.flush()
+        sys.stdout.buffer.write(output_json_bytes)
+        sys.stdout.buffer.flush()
         sys.exit(1) # Exit with a non-zero status code to signal the crash.
 
     # --- Successful execution path ---
-    output_json_str = final_dj_state_for_output.model_dump_json(
+    # Write UTF-8 bytes straight to the binary stream; no str round trip.
+    output_json_bytes = serialize_job(
+        final_dj_state_for_output,
         indent=2 if os.environ.get("SDE_PRETTY_PRINT_JSON", "false").lower() == "true" else None
     )
-    sys.stdout.write(output_json_str)
-    sys.stdout.flush()
+    sys.stdout.buffer.write(output_json_bytes)
+    sys.stdout.buffer.flush()
     
     logger.info(f"[{final_dj_state_for_output.case_id}] Investigator (__main__): Successfully completed execution.")
     sys.exit(0)
@@ -13,7 +13,7 @@ from typing import Dict, List, Any, Optional
 
 # --- Attempt to import SDE utilities ---
 try:
-    from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet
+    from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet, serialize_job
     from smart_pandoc_debugger.managers.oracle_team.seer import extract_primary_error_details
 except ModuleNotFoundError:
     # If the script is run directly, the utils module might not be in the Python path.
@@ -24,7 +24,7 @@ except ModuleNotFoundError:
         sys.path.insert(0, project_root)
     
     try:
-        from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet
+        from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet, serialize_job
         from smart_pandoc_debugger.managers.oracle_team.seer import extract_primary_error_details
     except ModuleNotFoundError as e:
         print(f"CRITICAL ORACLE ERROR: Failed to import SDE utilities or Seer specialist. Error: {e}", file=sys.stderr)
@@ -181,25 +181,31 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.process_job:
-        initial_job_json_str = ""
+        initial_job_json_bytes = b""
         try:
-            initial_job_json_str = sys.stdin.read()
-            assert initial_job_json_str, "Oracle (--process-job): Received empty stdin."
+            # Raw bytes straight into pydantic-core's JSON parser; no str decode.
+            initial_job_json_bytes = sys.stdin.buffer.read()
+            assert initial_job_json_bytes, "Oracle (--process-job): Received empty stdin."
             
-            diagnostic_job_input = DiagnosticJob.model_validate_json(initial_job_json_str)
+            diagnostic_job_input = DiagnosticJob.model_validate_json(initial_job_json_bytes)
             
             # Call the main logic function
             diagnostic_job_output = consult_the_oracle(diagnostic_job_input)
             
-            sys.stdout.write(diagnostic_job_output.model_dump_json(indent=2))
-            sys.stdout.flush()
+            # Write UTF-8 bytes straight to the binary stream; no str round trip.
+            output_json_bytes = serialize_job(
+                diagnostic_job_output,
+                indent=2 if os.environ.get("SDE_PRETTY_PRINT_JSON", "false").lower() == "true" else None
+            )
+            sys.stdout.buffer.write(output_json_bytes)
+            sys.stdout.buffer.flush()
             logger.info(f"[{getattr(diagnostic_job_output, 'case_id', 'unknown')}] Oracle: Successfully completed --process-job execution.")
             sys.stderr.flush()
             sys.exit(0)
         except Exception as e_main:
             case_id_for_error = "unknown_case_oracle_main"
             try: 
-                temp_data = json.loads(initial_job_json_str)
+                temp_data = json.loads(initial_job_json_bytes)
                 case_id_for_error = temp_data.get("case_id", "unknown_case_in_json")
             except: pass
             logger.error(f"[{case_id_for_error}] Oracle (--process-job): Unexpected error: {type(e_main).__name__} - {e_main}", exc_info=True)
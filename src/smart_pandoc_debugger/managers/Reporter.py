@@ -27,21 +27,20 @@
 
 import sys
 import os
-import json
 import logging
 import argparse
 import textwrap
 
 # Attempt to import SDE utilities
 try:
-    from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet
+    from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet, serialize_job
 except ModuleNotFoundError:
     current_script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(current_script_dir)
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
     try:
-        from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet
+        from utils.data_model import DiagnosticJob, ActionableLead, MarkdownRemedy, SourceContextSnippet, serialize_job
     except ModuleNotFoundError as e_inner:
         print(f"CRITICAL REPORTER ERROR: Failed to import SDE utilities. Error: {e_inner}", file=sys.stderr)
         class DiagnosticJob: pass # type: ignore
@@ -239,19 +238,21 @@ if __name__ == "__main__":
 
     assert args.process_job, "Reporter.py CRITICAL: Must be called with --process-job flag."
 
-    input_json_str = sys.stdin.read()
-    assert input_json_str.strip(), "Reporter.py CRITICAL: Received empty input from stdin."
+    # Raw bytes straight into pydantic-core's JSON parser: no str decode, no dict intermediary.
+    input_json_bytes = sys.stdin.buffer.read()
+    assert input_json_bytes.strip(), "Reporter.py CRITICAL: Received empty input from stdin."
     
-    diagnostic_job_dict_input = json.loads(input_json_str)
-    diagnostic_job_model_input = DiagnosticJob(**diagnostic_job_dict_input)
+    diagnostic_job_model_input = DiagnosticJob.model_validate_json(input_json_bytes)
     
     diagnostic_job_model_output = process_diagnostic_job(diagnostic_job_model_input)
     
-    output_json_str = diagnostic_job_model_output.model_dump_json(
+    # Write UTF-8 bytes straight to the binary stream; no str round trip.
+    output_json_bytes = serialize_job(
+        diagnostic_job_model_output,
         indent=2 if os.environ.get("SDE_PRETTY_PRINT_JSON", "false").lower() == "true" else None
     )
-    sys.stdout.write(output_json_str)
-    sys.stdout.flush()
+    sys.stdout.buffer.write(output_json_bytes)
+    sys.stdout.buffer.flush()
     
     logger.info(f"[{getattr(diagnostic_job_model_output, 'case_id', 'unknown')}] Reporter: Successfully completed execution.")
     sys.exit(0)
@@ -18,18 +18,13 @@ Fails violently for critical setup issues (e.g., Pandoc not found, utils not imp
 import logging
 import pathlib
 import subprocess
-from typing import List, Optional, NamedTuple
+from typing import List
 
 # SDE utilities (expected to be on PYTHONPATH)
 from utils.process_runner import run_script
 
-# Define result type locally instead of importing from a central model
-PandocConversionResult = NamedTuple("PandocConversionResult", [
-    ("conversion_successful", bool),
-    ("output_tex_file_path", Optional[pathlib.Path]),
-    ("generated_tex_content", Optional[str]),
-    ("pandoc_raw_log", Optional[str])
-])
+# Result type from the pydantic-free shared types module
+from smart_pandoc_debugger.data_types import PandocConversionResult
 
 logger = logging.getLogger(__name__)
 
@@ -19,17 +19,13 @@ import logging
 import pathlib
 import subprocess
 import shutil
-from typing import List, Optional, Union, NamedTuple
+from typing import List
 
 # SDE utilities (expected to be on PYTHONPATH)
 from utils.process_runner import run_script
 
-# Define result type locally instead of importing from a central model
-TexCompilationResult = NamedTuple("TexCompilationResult", [
-    ("compilation_successful", bool),
-    ("pdf_file_path", Optional[pathlib.Path]),
-    ("tex_compiler_raw_log", Optional[str])
-])
+# Result type from the pydantic-free shared types module
+from smart_pandoc_debugger.data_types import TexCompilationResult
 
 logger = logging.getLogger(__name__)
 if not logger.handlers: # Basic config if not already configured by a parent
@@ -0,0 +1,19 @@
+"""Shared fixtures for the utils unit tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# The PR helper scripts import their siblings as top-level modules
+# (`from gh_api_client import ...`), so put the utils directory itself on the path.
+UTILS_DIR = Path(__file__).resolve().parents[3] / "utils"
+if str(UTILS_DIR) not in sys.path:
+    sys.path.insert(0, str(UTILS_DIR))
+
+
+@pytest.fixture(scope="session")
+def latest_commit_hash():
+    """Resolve the current commit once per session instead of forking git per test."""
+    import pr_response_helper
+    return pr_response_helper.get_latest_commit_hash()
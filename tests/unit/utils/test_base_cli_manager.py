@@ -1,6 +1,10 @@
 # tests/unit/utils/test_base_cli_manager.py
-import pytest
+import io
 import json
+import sys
+from unittest import mock
+
+import pytest
 from argparse import ArgumentParser # Added
 from smart_pandoc_debugger.data_model import DiagnosticJob, StatusEnum # Added StatusEnum
 # from utils.base_cli_manager import BaseCliManager # or however it's structured/used
@@ -45,28 +49,33 @@ def test_base_cli_manager_reads_diagnostic_job_from_stdin(mocker):
     # # assert processed_job.original_markdown_content == "stdin test"
     pass
 
-def test_base_cli_manager_writes_diagnostic_job_to_stdout(mocker):
+def test_base_cli_manager_writes_diagnostic_job_to_stdout(monkeypatch):
     """Test writing the processed DiagnosticJob JSON to stdout."""
-    # mock_stdout = mocker.patch('sys.stdout')
-    # input_job = MockManagerDiagnosticJob(original_markdown_content="stdout test")
-    #
-    # # Simulate the manager processing logic
-    # # manager = SampleManager()
-    # # processed_job = manager.process_job_logic(input_job) # Directly call logic
-    #
-    # # Simulate writing output (part of manager's main/run)
-    # # print(processed_job.model_dump_json()) # This would be called by manager
-    # # mock_stdout.write.assert_called_once_with(processed_job.model_dump_json())
-    pass
+    from utils.base_cli_manager import run_manager_script
+
+    input_job = MockManagerDiagnosticJob(original_markdown_path="stdout_test.md")
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(input_job.model_dump_json().encode())))
+    monkeypatch.setattr(sys, "stdout", stdout)
 
-def test_base_cli_manager_handles_invalid_json_input(mocker):
+    run_manager_script(lambda job: job)
+
+    written = stdout.buffer.getvalue()
+    assert b"\n" not in written  # Compact when not writing to a terminal.
+    assert json.loads(written)["original_markdown_path"] == "stdout_test.md"
+
+def test_base_cli_manager_handles_invalid_json_input(monkeypatch):
     """Test behavior with malformed JSON from stdin."""
-    # mock_stdin = mocker.patch('sys.stdin')
-    # mock_stdin.read.return_value = "not valid json"
-    # # manager = SampleManager()
-    # # with pytest.raises(json.JSONDecodeError): # Or custom error
-    # #     manager.main(["--process-job"]) # Hypothetical
-    pass
+    from utils.base_cli_manager import run_manager_script
+
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"not valid json")))
+    processing_function = mock.Mock()
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_manager_script(processing_function)
+
+    assert exc_info.value.code == 1
+    processing_function.assert_not_called()
 
 def test_base_cli_manager_handles_json_not_matching_model(mocker):
     """Test behavior with valid JSON that doesn't conform to DiagnosticJob."""
@@ -165,8 +174,24 @@ def test_base_cli_manager_main_entry_point_with_args():
     """Test the main function/entry point with --process-job."""
     pass
 
-def test_base_cli_manager_error_handling_in_process_job_logic():
+def test_base_cli_manager_error_handling_in_process_job_logic(monkeypatch, capsys):
     """Test if errors in the derived process_job_logic are caught and handled (e.g. logged, exit code)."""
-    pass
+    from utils.base_cli_manager import run_manager_script
+
+    input_job = MockManagerDiagnosticJob(original_markdown_path="crash.md")
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(input_job.model_dump_json().encode())))
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    def processing_function(job):
+        raise RuntimeError("boom")
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_manager_script(processing_function)
+
+    assert exc_info.value.code == 1
+    assert "Traceback" in capsys.readouterr().err
+    history = json.loads(stdout.buffer.getvalue())["history"]
+    assert history[-1][1] == "FATAL ERROR: RuntimeError: boom"
 
 # ~20 stubs for base_cli_manager.py
@@ -1,5 +1,6 @@
 # tests/unit/utils/test_data_model.py
 import pytest
+from pydantic import ValidationError
 from smart_pandoc_debugger.data_model import (
     DiagnosticJob, 
     ActionableLead, 
@@ -11,8 +12,18 @@ from smart_pandoc_debugger.data_model import (
     SourceContextSnippet,
     PipelineStatus
 )
+from smart_pandoc_debugger import Coordinator as coord_module
+import re
+import shutil
 import time
 
+# Subprocess-based user expectation tests need the installed `spd` entry point.
+# Skip them at collection time rather than waiting on a missing/broken binary.
+requires_spd = pytest.mark.skipif(shutil.which("spd") is None, reason="spd binary not installed")
+
+# Keywords that indicate distinct issue types in `spd` output.
+_ISSUE_PAT = re.compile(r"bold|math|dollar|itemize|environment|command|undefined", re.I)
+
 # Test DiagnosticJob Model
 def test_diagnosticjob_creation_minimal():
     """Test minimal DiagnosticJob creation."""
@@ -114,6 +125,23 @@ def test_actionablelead_context_handling():
     # assert "```\ncode\n```" in lead.primary_context_snippets[0].snippet_text
     pass
 
+def test_sourcecontextsnippet_is_frozen_and_hashable():
+    """Snippets are immutable value objects."""
+    snippet = SourceContextSnippet(source_document_type="markdown", snippet_text="x")
+    with pytest.raises(ValidationError):
+        snippet.snippet_text = "y"
+    assert hash(snippet) == hash(SourceContextSnippet(source_document_type="markdown", snippet_text="x"))
+
+def test_small_vocabulary_fields_are_interned():
+    """Decoded leads share one string object per document type / service name."""
+    payload = ('{"source_service": "Investigator", "problem_description": "p", "primary_context_snippets": '
+               '[{"source_document_type": "tex_compilation_log", "snippet_text": "x"}]}')
+    first = ActionableLead.model_validate_json(payload)
+    second = ActionableLead.model_validate_json(payload)
+    assert first.source_service is second.source_service
+    assert first.primary_context_snippets[0].source_document_type is \
+        second.primary_context_snippets[0].source_document_type
+
 def test_actionablelead_confidence_score_handling():
     """Test ActionableLead confidence_score."""
     # lead = ActionableLead(problem_description="Test", source_service="Test", confidence_score=0.5)
@@ -843,9 +871,6 @@ def test_cli_version_command_execution():
 
 def test_coordinator_basic_workflow():
     """Test Coordinator can be instantiated and handle basic workflow."""
-    # Import the Coordinator module and test basic instantiation
-    import smart_pandoc_debugger.Coordinator as coord_module
-    
     # Basic smoke test - module should be importable and have expected structure
     assert hasattr(coord_module, '__file__')
     
@@ -860,6 +885,7 @@ def test_coordinator_basic_workflow():
 
 # User Expectation Tests - Real Documents, Real Problems, Real Output (8 tests)
 
+@requires_spd
 def test_unclosed_math_dollars_detection():
     """Test that unclosed $ gives usable output."""
     import tempfile
@@ -896,6 +922,7 @@ More text here.
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_unmatched_braces_detection():
     """Test that unmatched braces give usable output."""
     import tempfile
@@ -929,6 +956,7 @@ More content.
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_valid_document_processes_successfully():
     """Test that a valid document processes without errors."""
     import tempfile
@@ -979,6 +1007,7 @@ This document should process cleanly.
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_mixed_markdown_latex_errors():
     """Test document with both markdown and LaTeX issues."""
     import tempfile
@@ -1012,13 +1041,13 @@ Also \\unknowncommand{here}.
         assert len(output) > 0
         
         # Should detect multiple types of issues
-        issue_count = sum(1 for word in ['bold', 'math', 'dollar', 'itemize', 'environment', 'command', 'undefined'] 
-                         if word in output.lower())
+        issue_count = len(set(m.group().lower() for m in _ISSUE_PAT.finditer(output)))
         assert issue_count >= 2  # Should catch multiple issue types
         
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_empty_document_handling():
     """Test that empty documents are handled gracefully."""
     import tempfile
@@ -1049,24 +1078,19 @@ def test_empty_document_handling():
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_very_long_document_handling():
     """Test that long documents are handled efficiently."""
     import tempfile
     import os
     import subprocess
     
-    # Generate a long document
-    long_content = []
-    for i in range(100):
-        long_content.append(f"## Section {i}")
-        long_content.append(f"Content for section {i} with some **bold** text.")
-        long_content.append(f"And math: $x_{i} = {i}$")
-        long_content.append("")
-    
-    long_doc = "\n".join(long_content)
-    
+    # Generate a long document, streaming each section straight to disk
     with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write(long_doc)
+        for i in range(100):
+            f.write(f"## Section {i}\n"
+                    f"Content for section {i} with some **bold** text.\n"
+                    f"And math: $x_{i} = {i}$\n\n")
         temp_path = f.name
     
     try:
@@ -1085,6 +1109,7 @@ def test_very_long_document_handling():
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_special_characters_in_document():
     """Test documents with special characters and unicode."""
     import tempfile
@@ -1125,6 +1150,7 @@ Code: `print("Hello 世界")`
     finally:
         os.unlink(temp_path)
 
+@requires_spd
 def test_help_output_is_useful():
     """Test that help output actually helps users."""
     import subprocess
@@ -1,6 +1,10 @@
 # tests/unit/utils/test_logger_utils.py
+import re
+
 import pytest
 import logging
+
+import logger_utils  # utils/ is put on sys.path by conftest.py
 # from utils.logger_utils import setup_logger, get_logger # Example functions/classes
 
 # Most logger tests involve checking handler configuration, log levels,
@@ -183,4 +187,25 @@ def test_file_handler_configuration(logger_name_fixture, tmp_path):
     # assert "Error to file" in log_file.read_text()
     pass
 
+def test_sde_logger_prefix_format():
+    """The SdeLogger prefix is 'YYYY-mm-dd HH:MM:SS.mmm LEVEL (NAME):'."""
+    sde_logger = logger_utils.SdeLogger()
+    prefix = sde_logger._get_prefix("warning", "miner")
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3} WARNING \(MINER\):", prefix)
+    sde_logger.set_log_prefix_override("OVERRIDE")
+    assert sde_logger._get_prefix("error", "miner").endswith(" ERROR (OVERRIDE):")
+
+def test_sde_logger_set_debug_toggles_debug_and_info(capsys):
+    """debug()/info() print only while debugging is on; warnings always print."""
+    sde_logger = logger_utils.SdeLogger()
+    sde_logger.set_debug(False)
+    sde_logger.debug("hidden debug")
+    sde_logger.info("hidden info")
+    sde_logger.warning("shown warning")
+    sde_logger.set_debug(True)
+    sde_logger.debug("shown debug")
+    err = capsys.readouterr().err
+    assert "hidden" not in err
+    assert "shown warning" in err and "shown debug" in err
+
 # ~20 stubs for logger_utils.py
@@ -5,15 +5,15 @@ This module tests the PR response helper that assists LLMs in responding
 to PR comments following the protocol described in CONTRIBUTING.md.
 """
 
+import json
+import shlex
 import pytest
-import sys
-import os
+import subprocess
 from unittest.mock import patch, MagicMock
 
-# Add the utils directory to the path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "utils"))
-
+# The utils directory is put on sys.path by tests/unit/utils/conftest.py.
 try:
+    import gh_api_client
     import pr_response_helper
 except ImportError:
     pytest.skip("PR response helper not available", allow_module_level=True)
@@ -41,6 +41,15 @@ class TestPRResponseHelper:
             "user": {"login": "codepilot-assistant", "type": "Bot"}
         }
         assert pr_response_helper.is_from_bot(codepilot_comment)
+        
+        # Test account typed as a bot whose login has no bot marker
+        typed_bot_comment = {
+            "user": {"login": "Copilot", "type": "Bot"}
+        }
+        assert pr_response_helper.is_from_bot(typed_bot_comment)
+        
+        # Test login match is case-insensitive
+        assert pr_response_helper.is_from_bot({"user": {"login": "Renovate-Bot", "type": "User"}})
     
     def test_extract_comment_info(self):
         """Test comment information extraction."""
@@ -105,47 +114,147 @@ class TestPRResponseHelper:
         assert "Comment 1: test-bot" in result
         assert "Ready for resolution!" in result
     
+    def test_print_instructions_quotes_template_for_shell(self, capsys):
+        """Test the printed gh command passes the template through the shell verbatim."""
+        template = 'Use `code`, "quotes", $HOME and it\'s \\ fine'
+        
+        pr_response_helper.print_instructions("123", template)
+        
+        command = next(line for line in capsys.readouterr().out.splitlines()
+                       if line.startswith("GH_PAGER=cat"))
+        assert shlex.split(command)[-2:] == ["--body", template]
+    
+    @patch('gh_api_client._GH_EXE', '/usr/bin/gh')
     @patch('subprocess.run')
     def test_run_gh_command(self, mock_run):
         """Test GitHub CLI command execution."""
         mock_result = MagicMock()
-        mock_result.stdout = "test output"
-        mock_result.stderr = ""
+        mock_result.stdout = b"test output"
+        mock_result.stderr = b""
         mock_result.returncode = 0
         mock_run.return_value = mock_result
         
-        stdout, stderr, returncode = pr_response_helper.run_gh_command(["gh", "version"])
+        stdout, stderr, returncode = gh_api_client.run_gh_command(["gh", "version"])
         
-        assert stdout == "test output"
+        assert stdout == b"test output"
+        assert stderr == ""
         assert returncode == 0
         mock_run.assert_called_once()
+        # The executable resolved at import replaces the bare "gh"
+        assert mock_run.call_args.args[0] == ["/usr/bin/gh", "version"]
+        # gh must never page or prompt when driven from the helper.
+        called_env = mock_run.call_args.kwargs["env"]
+        assert called_env["GH_PAGER"] == "cat"
+        assert called_env["GH_PROMPT_DISABLED"] == "1"
+    
+    @patch('gh_api_client._GH_EXE', None)
+    @patch('subprocess.run')
+    def test_run_gh_command_without_gh(self, mock_run):
+        """Test a missing gh exits with an error instead of spawning anything."""
+        with pytest.raises(SystemExit) as exc_info:
+            gh_api_client.run_gh_command(["gh", "version"])
+        
+        assert exc_info.value.code == 1
+        mock_run.assert_not_called()
+    
+    @patch('gh_api_client.run_gh_command')
+    def test_fetch_pr_bundle(self, mock_gh):
+        """Test the single GraphQL fetch is reshaped into REST-style records."""
+        author = {"login": "github-actions", "__typename": "Bot"}
+        mock_gh.return_value = (json.dumps({"data": {"repository": {"pullRequest": {
+            "number": 7, "title": "T", "url": "https://github.com/o/r/pull/7",
+            "mergeable": "MERGEABLE", "mergeStateStatus": "CLEAN",
+            "commits": {"nodes": [{"commit": {"statusCheckRollup": {"state": "SUCCESS"}}}]},
+            "reviews": {"nodes": [{"comments": {"nodes": [{
+                "databaseId": 1, "url": "u1", "body": "Fix", "createdAt": "2024-01-01T00:00:00Z",
+                "path": "a.py", "line": 3, "originalLine": 3, "author": author}]}}]},
+            "comments": {"nodes": [{
+                "databaseId": 2, "url": "u2", "body": "Hi", "createdAt": "2024-01-02T00:00:00Z",
+                "author": None}]},
+        }}}}).encode(), "", 0)
+        gh_api_client._PR_BUNDLES.clear()
+        
+        pr_info, review_comments, issue_comments = gh_api_client.fetch_pr_bundle("7")
+        
+        # The getters read from the cached bundle instead of calling gh again
+        assert gh_api_client.get_review_comments("7") is review_comments
+        assert gh_api_client.get_issue_comments(7) is issue_comments
+        mock_gh.assert_called_once()
+        assert pr_info["statusCheckRollup"] == {"state": "SUCCESS"}
+        assert review_comments[0]["user"] == {"login": "github-actions", "type": "Bot"}
+        assert review_comments[0]["path"] == "a.py" and review_comments[0]["line"] == 3
+        assert issue_comments[0]["id"] == 2 and "path" not in issue_comments[0]
+        assert issue_comments[0]["user"]["login"] == "ghost"
     
-    def test_get_latest_commit_hash(self):
+    @patch('gh_api_client.run_gh_command')
+    def test_fetch_pr_bundle_follows_next_pages(self, mock_gh):
+        """Test connections with more than one page are completed with follow-up queries."""
+        def comment(database_id, **extra):
+            return {"databaseId": database_id, "url": f"u{database_id}", "body": "b",
+                    "createdAt": "2024-01-01T00:00:00Z", "author": None, **extra}
+        
+        def page(nodes, cursor=None):
+            return {"pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}, "nodes": nodes}
+        
+        def response(data):
+            return json.dumps({"data": data}).encode(), "", 0
+        
+        mock_gh.side_effect = [
+            response({"repository": {"pullRequest": {
+                "number": 8, "title": "T", "url": "u", "mergeable": "MERGEABLE", "mergeStateStatus": "CLEAN",
+                "commits": {"nodes": []},
+                "reviews": page([{"id": "R1", "comments": page([comment(1, path="a.py")], "rc1")}], "rv1"),
+                "comments": page([comment(3)], "ic1"),
+            }}}),
+            response({"repository": {"pullRequest": {"reviews": page(
+                [{"id": "R2", "comments": page([comment(5, path="b.py")])}])}}}),
+            response({"node": {"comments": page([comment(2, path="a.py")])}}),
+            response({"repository": {"pullRequest": {"comments": page([comment(4)])}}}),
+        ]
+        gh_api_client._PR_BUNDLES.clear()
+        
+        _, review_comments, issue_comments = gh_api_client.fetch_pr_bundle("8")
+        
+        assert [c["id"] for c in review_comments] == [1, 2, 5]
+        assert [c["id"] for c in issue_comments] == [3, 4]
+        reviews_page_cmd, review_page_cmd, issue_page_cmd = (c.args[0] for c in mock_gh.call_args_list[1:])
+        assert "cursor=rv1" in reviews_page_cmd and "number=8" in reviews_page_cmd
+        assert "owner={owner}" in reviews_page_cmd and "repo={repo}" in reviews_page_cmd
+        assert "id=R1" in review_page_cmd and "cursor=rc1" in review_page_cmd
+        assert "cursor=ic1" in issue_page_cmd and "number=8" in issue_page_cmd
+    
+    def test_get_latest_commit_hash(self, latest_commit_hash):
         """Test getting the latest commit hash."""
         # This should work in any git repository
-        result = pr_response_helper.get_latest_commit_hash()
+        result = latest_commit_hash
         
         # Should either return a hash or the placeholder
         assert isinstance(result, str)
         assert len(result) > 0
+    
+    @patch('subprocess.run')
+    def test_get_latest_commit_hash_fallback(self, mock_run):
+        """Test the placeholder is returned when git fails (no real git call)."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=128, stdout="", stderr="fatal: not a git repository"
+        )
+        
+        assert pr_response_helper.get_latest_commit_hash() == "[COMMIT_HASH]"
 
 
 class TestMainFunctionality:
     """Integration tests for main functionality."""
     
-    @patch('pr_response_helper.get_pr_info')
-    @patch('pr_response_helper.get_review_comments')
-    @patch('pr_response_helper.get_issue_comments')
-    def test_main_with_no_comments(self, mock_issue_comments, mock_review_comments, mock_pr_info):
+    @patch('pr_response_helper.fetch_pr_bundle')
+    def test_main_with_no_comments(self, mock_fetch_bundle):
         """Test main function with no bot comments."""
-        mock_pr_info.return_value = {
+        pr_info = {
             "number": 123,
             "title": "Test PR",
             "url": "https://github.com/user/repo/pull/123",
             "repository": {"url": "https://github.com/user/repo"}
         }
-        mock_review_comments.return_value = []
-        mock_issue_comments.return_value = []
+        mock_fetch_bundle.return_value = (pr_info, [], [])
         
         # Mock sys.argv to simulate command line usage
         with patch('sys.argv', ['pr_response_helper.py', '123']):
@@ -159,6 +268,20 @@ class TestMainFunctionality:
                 print_calls = [str(call) for call in mock_print.call_args_list]
                 assert any("No bot comments found" in call for call in print_calls)
 
+    
+    @patch('pr_response_helper.auto_detect_pr_number')
+    @patch('pr_response_helper.fetch_pr_bundle')
+    def test_main_show_template_only_makes_no_gh_calls(self, mock_fetch_bundle, mock_detect, capsys):
+        """Test --show-template-only prints a placeholder template without calling gh."""
+        with patch('sys.argv', ['pr_response_helper.py', '--show-template-only']):
+            pr_response_helper.main()
+        
+        mock_fetch_bundle.assert_not_called()
+        mock_detect.assert_not_called()
+        out = capsys.readouterr().out
+        assert "🔗 Response to Reviewer Comments" in out
+        assert "[COMMENT_URL]" in out
+
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -1,7 +1,12 @@
 # tests/unit/utils/test_process_runner.py
+import os
 import pytest
 import subprocess
-# from utils.process_runner import run_process # Assuming this is the main function/class
+from utils import process_runner
+from utils.process_runner import run_process
+
+# Placeholder tests: skipped up front so pytest does not resolve their fixtures.
+stub = pytest.mark.skip(reason="stub: not implemented yet")
 
 # Setup - potentially mock subprocess
 @pytest.fixture
@@ -10,20 +15,32 @@ def mock_subprocess_run(mocker):
 
 def test_run_process_success(mock_subprocess_run):
     """Test run_process with a successful command."""
-    # mock_subprocess_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="success", stderr="")
-    # result = run_process(["echo", "hello"])
-    # assert result.return_code == 0
-    # assert result.stdout == "success"
-    pass
+    mock_subprocess_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"success", stderr=b"")
+    result = run_process(["echo", "hello"], input=b"{}")
+    assert result.returncode == 0
+    assert result.stdout == b"success"
+    assert mock_subprocess_run.call_args.kwargs["input"] == b"{}"
 
 def test_run_process_failure(mock_subprocess_run):
     """Test run_process with a failing command."""
-    # mock_subprocess_run.return_value = subprocess.CompletedProcess(args=[], returncode=1, stdout="", stderr="error")
-    # result = run_process(["false"])
-    # assert result.return_code == 1
-    # assert result.stderr == "error"
-    pass
-
+    mock_subprocess_run.return_value = subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"error")
+    result = run_process(["false"])  # Unchecked: the caller decides what a failure means.
+    assert result.returncode == 1
+    assert result.stderr == b"error"
+
+def test_run_script_env_prepends_project_root(mock_subprocess_run):
+    """Test run_script shares the prebuilt env and keeps the project root first on PYTHONPATH."""
+    mock_subprocess_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+    process_runner.run_script(["tool"])
+    assert mock_subprocess_run.call_args.kwargs["env"] is process_runner._PROJECT_ENV
+
+    process_runner.run_script(["tool"], env_additions={"PYTHONPATH": "/extra", "FOO": "1"})
+    env = mock_subprocess_run.call_args.kwargs["env"]
+    assert env["PYTHONPATH"].split(os.pathsep) == [str(process_runner.PROJECT_ROOT_PATH), "/extra"]
+    assert env["FOO"] == "1"
+    assert "FOO" not in process_runner._PROJECT_ENV
+
+@stub
 def test_run_process_timeout(mock_subprocess_run):
     """Test run_process with a command that times out."""
     # mock_subprocess_run.side_effect = subprocess.TimeoutExpired(cmd=[], timeout=0.1)
@@ -31,6 +48,7 @@ def test_run_process_timeout(mock_subprocess_run):
     #   run_process(["sleep", "1"], timeout=0.1)
     pass
 
+@stub
 def test_run_process_command_not_found(mock_subprocess_run):
     """Test run_process with a command not found."""
     # mock_subprocess_run.side_effect = FileNotFoundError
@@ -38,71 +56,87 @@ def test_run_process_command_not_found(mock_subprocess_run):
     #   run_process(["nonexistent_command"])
     pass
 
+@stub
 def test_run_process_capture_stdout(mock_subprocess_run):
     """Test stdout is captured correctly."""
     pass
 
+@stub
 def test_run_process_capture_stderr(mock_subprocess_run):
     """Test stderr is captured correctly."""
     pass
 
+@stub
 def test_run_process_empty_command():
     """Test run_process with an empty command list."""
     # with pytest.raises(ValueError): # Or appropriate error
     #   run_process([])
     pass
 
+@stub
 def test_run_process_command_with_spaces(mock_subprocess_run):
     """Test command with spaces is handled (passed as list)."""
     pass
 
+@stub
 def test_run_process_encoding_handling(mock_subprocess_run):
     """Test different text encodings if applicable."""
     pass
 
+@stub
 def test_run_process_working_directory(mock_subprocess_run):
     """Test executing command in a specific working directory."""
     # run_process(["pwd"], cwd="/tmp")
     pass
 
+@stub
 def test_run_process_environment_variables(mock_subprocess_run):
     """Test passing custom environment variables."""
     # run_process(["env"], env={"MY_VAR": "value"})
     pass
 
+@stub
 def test_run_process_shell_true_security(mock_subprocess_run):
     """Test if shell=True is used, its implications are understood/tested (generally avoid)."""
     # This is more of a check on usage, not a direct stub
     pass
 
+@stub
 def test_run_process_large_output_stdout(mock_subprocess_run):
     """Test handling of large stdout."""
     pass
 
+@stub
 def test_run_process_large_output_stderr(mock_subprocess_run):
     """Test handling of large stderr."""
     pass
 
+@stub
 def test_run_process_binary_output(mock_subprocess_run):
     """Test handling of binary output if relevant."""
     pass
 
+@stub
 def test_run_process_input_stdin(mock_subprocess_run):
     """Test providing input via stdin to the process."""
     pass
 
+@stub
 def test_run_process_non_string_command_parts(mock_subprocess_run):
     """Test that non-string parts in command list raise error or are handled."""
     pass
 
+@stub
 def test_run_process_default_timeout_behavior(mock_subprocess_run):
     """Test behavior when no timeout is specified."""
     pass
 
+@stub
 def test_run_process_zero_timeout_behavior(mock_subprocess_run):
     """Test behavior with timeout=0."""
     pass
 
+@stub
 def test_run_process_negative_timeout_behavior(mock_subprocess_run):
     """Test behavior with negative timeout value."""
     pass
@@ -1,7 +1,7 @@
 """Test utilities and helpers."""
+import functools
 import json
 import os
-import re
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
@@ -9,11 +9,37 @@ from typing import Any, Dict, Generator, Optional, Type, TypeVar, Union
 
 import yaml
 
+# libyaml's C loader when PyYAML was built against it, the pure-Python one otherwise.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 T = TypeVar('T')
 
+@functools.lru_cache(maxsize=128)
+def _load_raw(path: str, mtime_ns: int) -> Any:
+    """Parse a fixture file; cached per (path, mtime) so each file is parsed once."""
+    suffix = Path(path).suffix.lower()
+    
+    # Both parsers take raw bytes and detect the UTF encoding themselves,
+    # so skip the text-mode decoding layer.
+    with open(path, 'rb') as f:
+        if suffix in ('.yaml', '.yml'):
+            return yaml.load(f, Loader=_YamlLoader)
+        elif suffix == '.json':
+            return json.load(f)
+        else:
+            raise ValueError(f'Unsupported file type: {suffix}')
+
+
 def load_test_data(filename: str, data_type: Type[T] = dict) -> T:
     """Load test data from a YAML or JSON file.
     
+    Parsed data is cached and shared between callers, so treat it as
+    read-only (`copy.deepcopy` it before mutating). Editing the file
+    invalidates the cache entry.
+    
     Args:
         filename: Name of the file in the test data directory.
         data_type: Expected return type (dict, list, etc.).
@@ -22,15 +48,7 @@ def load_test_data(filename: str, data_type: Type[T] = dict) -> T:
         The loaded data in the specified type.
     """
     path = Path(__file__).parent / 'data' / filename
-    suffix = path.suffix.lower()
-    
-    with open(path, 'r', encoding='utf-8') as f:
-        if suffix in ('.yaml', '.yml'):
-            data = yaml.safe_load(f)
-        elif suffix == '.json':
-            data = json.load(f)
-        else:
-            raise ValueError(f'Unsupported file type: {suffix}')
+    data = _load_raw(str(path), path.stat().st_mtime_ns)
     
     if not isinstance(data, data_type):
         raise ValueError(f'Expected {data_type}, got {type(data)}')
@@ -64,9 +82,6 @@ def assert_error_message_contains(
 
 
 @contextmanager
-tempfile_context = tempfile.NamedTemporaryFile
-
-
 def create_temp_file(
     content: str = '',
     suffix: str = '.txt',
@@ -82,23 +97,26 @@ def create_temp_file(
     Yields:
         Path to the created temporary file.
     """
-    with tempfile.NamedTemporaryFile(
-        mode='w',
-        suffix=suffix,
-        dir=str(dir) if dir else None,
-        delete=False,
-        encoding='utf-8'
-    ) as f:
-        f.write(content)
-        temp_path = Path(f.name)
+    fd, name = tempfile.mkstemp(suffix=suffix, dir=str(dir) if dir else None)
+    # Write the encoded bytes straight to the descriptor mkstemp opened;
+    # no text-mode wrapper needed.
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content.encode('utf-8'))
+    temp_path = Path(name)
     
     try:
         yield temp_path
     finally:
-        if temp_path.exists():
-            temp_path.unlink()
+        try:
+            os.unlink(name)
+        except FileNotFoundError:
+            pass
 
 
 def normalize_whitespace(text: str) -> str:
-    """Normalize whitespace in a string for comparison."""
-    return re.sub(r'\s+', ' ', text).strip()
+    """Normalize whitespace in a string for comparison.
+
+    `str.split()` with no arguments splits on runs of whitespace and drops
+    leading/trailing whitespace, so this needs neither a regex nor `strip()`.
+    """
+    return ' '.join(text.split())
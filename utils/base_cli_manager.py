@@ -2,18 +2,30 @@
 # Provides a simple lifecycle function for pipe-based manager scripts.
 
 import sys
-import json
-import traceback
-from .data_model import DiagnosticJob
+from .data_model import DiagnosticJob, serialize_job
 from .logger_utils import logger
 import pydantic
 
+
+def _write_job(job: DiagnosticJob) -> None:
+    """
+    Writes the job to stdout as UTF-8 JSON bytes.
+
+    Compact when piped to the Coordinator (the usual case); indented only when a
+    human is reading at a terminal.
+    """
+    indent = 2 if sys.stdout.isatty() else None
+    sys.stdout.flush()  # Keep anything already written through the text layer in order.
+    sys.stdout.buffer.write(serialize_job(job, indent=indent))
+    sys.stdout.buffer.flush()
+
+
 def run_manager_script(processing_function):
     """
     Handles the standard lifecycle of a manager script that operates in a pipe.
 
     This function is responsible for the boilerplate of:
-    1. Reading a JSON string from standard input.
+    1. Reading JSON bytes from standard input.
     2. Parsing and validating it into a DiagnosticJob Pydantic model.
     3. Calling the manager's specific `processing_function` with the job object.
     4. Taking the modified job object returned by the processing function.
@@ -37,33 +49,34 @@ def run_manager_script(processing_function):
     # pipeline and prevents cascading failures. Do not add broad, silent
     # error catching here without a very good reason.
     try:
-        # 1. Read from stdin
-        input_json_str = sys.stdin.read()
-        if not input_json_str:
+        # 1. Read from stdin, as raw bytes: pydantic-core parses UTF-8 directly.
+        input_json_bytes = sys.stdin.buffer.read()
+        if not input_json_bytes:
             logger.error("BaseCliManager: Stdin was empty. No job to process.")
             sys.exit(1)
 
         # 2. Parse and validate
-        job = DiagnosticJob.parse_raw(input_json_str)
+        job = DiagnosticJob.model_validate_json(input_json_bytes)
         job.log_message(f"Successfully parsed job. Current status: {job.status.value}")
 
         # 3. Call the manager's main logic
         updated_job = processing_function(job)
 
         # 4. Serialize and 5. Print to stdout
-        sys.stdout.write(updated_job.model_dump_json(indent=2))
+        _write_job(updated_job)
 
-    except json.JSONDecodeError:
-        logger.error("BaseCliManager: Failed to decode JSON from stdin.")
-        sys.exit(1)
     except pydantic.ValidationError as e:
+        # model_validate_json reports malformed JSON as a ValidationError too.
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            logger.error("BaseCliManager: Failed to decode JSON from stdin.")
+            sys.exit(1)
         logger.error(f"BaseCliManager: Input data failed validation for DiagnosticJob.\n{e}")
         sys.exit(1)
     except Exception as e:
-        tb_str = traceback.format_exc()
-        logger.error(f"BaseCliManager: An unexpected error occurred during job processing: {e}\n{tb_str}")
+        # The full traceback goes to stderr once; the job only keeps a one-line summary.
+        logger.exception(f"BaseCliManager: An unexpected error occurred during job processing: {e}")
         # Attempt to write out the job state before failing if possible
         if 'job' in locals() and isinstance(job, DiagnosticJob):
-            job.log_message(f"FATAL ERROR: {e}\n{tb_str}")
-            sys.stdout.write(job.model_dump_json(indent=2))
+            job.log_message(f"FATAL ERROR: {type(e).__name__}: {e}")
+            _write_job(job)
         sys.exit(1)
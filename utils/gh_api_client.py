@@ -4,86 +4,268 @@ GitHub API Client for PR Operations
 ===================================
 
 Handles all GitHub CLI interactions for PR response helper.
+
+Everything goes through the `gh` CLI rather than an HTTP client: `gh` owns
+authentication (`gh auth login`, no token handling here), resolves the
+`{owner}`/`{repo}` placeholders from the current checkout, and adds no Python
+dependencies to a helper script that runs a handful of requests per invocation.
 """
 
+from __future__ import annotations
+
+import functools
 import json
 import os
+import shutil
 import subprocess
 import sys
-from typing import Dict, List, Tuple
+from collections.abc import Callable
 
 
-def run_gh_command(cmd: List[str]) -> Tuple[str, str, int]:
-    """Run a GitHub CLI command with proper environment setup."""
-    env = {"GH_PAGER": "cat", "GH_PROMPT_DISABLED": "1"}
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            env={**os.environ, **env},
-            input=""  # Provide empty stdin to prevent interactive prompts
-        )
-        return result.stdout, result.stderr, result.returncode
-    except FileNotFoundError:
+# Environment for every `gh` call: ours (as of import), with paging and prompts disabled.
+_GH_ENV = {**os.environ, "GH_PAGER": "cat", "GH_PROMPT_DISABLED": "1"}
+
+# `gh` is either on PATH for the whole run or not at all, so resolve it once.
+# A missing `gh` is still reported on first use, not at import, so that
+# `--help` and the unit tests work without it.
+_GH_EXE = shutil.which("gh")
+
+
+def run_gh_command(cmd: list[str]) -> tuple[bytes, str, int]:
+    """Run a GitHub CLI command with proper environment setup.
+
+    stdout is returned as raw bytes (`json.loads` parses UTF-8 bytes directly,
+    so the payload is never decoded to `str` first); stderr is decoded for display.
+    """
+    if _GH_EXE is None:
         print("❌ Error: GitHub CLI (gh) not found. Please install it first.")
         sys.exit(1)
+    result = subprocess.run(
+        [_GH_EXE, *cmd[1:]],  # cmd[0] is "gh"; use the path resolved at import
+        capture_output=True,
+        env=_GH_ENV,
+        stdin=subprocess.DEVNULL  # No stdin, so gh can never prompt
+    )
+    return result.stdout, result.stderr.decode("utf-8", errors="replace"), result.returncode
+
+
+def get_pr_info(pr_number: str) -> dict:
+    """Fetch PR information (title, url, merge and check state)."""
+    return fetch_pr_bundle(pr_number)[0]
+
+
+def get_review_comments(pr_number: str) -> list[dict]:
+    """Fetch all review comments from the PR."""
+    return fetch_pr_bundle(pr_number)[1]
+
+
+def get_issue_comments(pr_number: str) -> list[dict]:
+    """Fetch all issue comments (general PR comments) from the PR."""
+    return fetch_pr_bundle(pr_number)[2]
+
+
+# Everything main() needs in one round trip: PR metadata, merge/check state,
+# review (line) comments and issue (conversation) comments. Connections that
+# hold more than 100 nodes are finished with the *_PAGE_QUERY follow-ups below.
+PR_BUNDLE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number
+      title
+      url
+      mergeable
+      mergeStateStatus
+      commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }
+      reviews(first: 100) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          comments(first: 100) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              databaseId url body createdAt path line originalLine
+              author { login __typename }
+            }
+          }
+        }
+      }
+      comments(first: 100) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId url body createdAt author { login __typename } }
+      }
+    }
+  }
+}
+"""
+
+REVIEWS_PAGE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      reviews(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          comments(first: 100) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              databaseId url body createdAt path line originalLine
+              author { login __typename }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+REVIEW_COMMENTS_PAGE_QUERY = """
+query($id: ID!, $cursor: String!) {
+  node(id: $id) {
+    ... on PullRequestReview {
+      comments(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          databaseId url body createdAt path line originalLine
+          author { login __typename }
+        }
+      }
+    }
+  }
+}
+"""
 
+ISSUE_COMMENTS_PAGE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!, $cursor: String!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      comments(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes { databaseId url body createdAt author { login __typename } }
+      }
+    }
+  }
+}
+"""
 
-def get_pr_info(pr_number: str) -> Dict:
-    """Fetch PR information including repository details."""
-    print(f"🔍 Fetching PR #{pr_number} information...")
 
+def _graphql(query: str, fields: list[str], what: str) -> dict:
+    """Run one `gh api graphql` query and return its `data`; exits on any error."""
     stdout, stderr, returncode = run_gh_command([
-        "gh", "pr", "view", pr_number, "--json",
-        "number,title,url,reviews,comments,mergeable,mergeStateStatus,statusCheckRollup"
+        "gh", "api", "graphql", *fields, "-f", f"query={query}"
     ])
 
     if returncode != 0:
-        print(f"❌ Error fetching PR info: {stderr}")
+        print(f"❌ Error fetching {what}: {stderr}")
         sys.exit(1)
 
     try:
-        return json.loads(stdout)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error parsing PR data: {e}")
+        return json.loads(stdout)["data"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"❌ Error parsing {what}: {e}")
         sys.exit(1)
 
 
-def get_review_comments(pr_number: str) -> List[Dict]:
-    """Fetch all review comments from the PR."""
-    print(f"💬 Fetching review comments for PR #{pr_number}...")
+def _pr_fields(pr_number: str) -> list[str]:
+    """`gh api graphql` fields selecting the PR; gh fills {owner}/{repo} from the checkout."""
+    return ["-F", "owner={owner}", "-F", "repo={repo}", "-F", f"number={pr_number}"]
 
-    stdout, stderr, returncode = run_gh_command([
-        "gh", "api", f"/repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments"
-    ])
 
-    if returncode != 0:
-        print(f"❌ Error fetching review comments: {stderr}")
-        return []
+def _all_nodes(connection: dict, fetch_page: Callable[[str], dict]) -> list[dict]:
+    """Return every node of `connection`, following `endCursor` while `hasNextPage` is set.
 
-    try:
-        return json.loads(stdout)
-    except json.JSONDecodeError:
-        return []
+    `fetch_page(cursor)` returns the next page of the same connection.
+    """
+    nodes = list(connection["nodes"])
+    page_info = connection.get("pageInfo") or {}
+    while page_info.get("hasNextPage"):
+        connection = fetch_page(page_info["endCursor"])
+        nodes.extend(connection["nodes"])
+        page_info = connection["pageInfo"]
+    return nodes
 
 
-def get_issue_comments(pr_number: str) -> List[Dict]:
-    """Fetch all issue comments (general PR comments) from the PR."""
-    print(f"💭 Fetching issue comments for PR #{pr_number}...")
+def _rest_comment(node: dict) -> dict:
+    """Reshape a GraphQL comment node into the REST comment shape used by the helper."""
+    author = node.get("author") or {}  # null for deleted accounts
+    comment = {
+        "id": node["databaseId"],
+        "html_url": node["url"],
+        "body": node["body"],
+        "user": {"login": author.get("login", "ghost"), "type": author.get("__typename", "User")},
+        "created_at": node["createdAt"],
+    }
+    if "path" in node:
+        comment["path"] = node["path"]
+        comment["line"] = node.get("line")
+        comment["original_line"] = node.get("originalLine")
+    return comment
 
-    stdout, stderr, returncode = run_gh_command([
-        "gh", "api", f"/repos/{{owner}}/{{repo}}/issues/{pr_number}/comments"
-    ])
 
-    if returncode != 0:
-        print(f"❌ Error fetching issue comments: {stderr}")
-        return []
+# Parsed bundles by PR number: every getter for a PR shares one `gh` call.
+_PR_BUNDLES: dict[str, tuple[dict, list[dict], list[dict]]] = {}
+
 
+def fetch_pr_bundle(pr_number: str) -> tuple[dict, list[dict], list[dict]]:
+    """Fetch PR info, review comments and issue comments with a single GraphQL query.
+
+    Reviews or comments past the first 100 of a connection are fetched with
+    follow-up page queries. Returns `(pr_info, review_comments, issue_comments)`,
+    with comments in the REST comment shape. The result is cached per PR
+    number for the life of the process.
+    """
+    pr_number = str(pr_number)
+    if pr_number in _PR_BUNDLES:
+        return _PR_BUNDLES[pr_number]
+
+    print(f"🔍 Fetching PR #{pr_number} information and comments...")
+
+    pr_fields = _pr_fields(pr_number)
     try:
-        return json.loads(stdout)
-    except json.JSONDecodeError:
-        return []
+        pr = _graphql(PR_BUNDLE_QUERY, pr_fields, "PR info")["repository"]["pullRequest"]
+    except (KeyError, TypeError) as e:
+        print(f"❌ Error parsing PR info: {e}")
+        sys.exit(1)
+
+    if pr is None:
+        print(f"❌ Error fetching PR info: PR #{pr_number} not found")
+        sys.exit(1)
+
+    commits = pr["commits"]["nodes"]
+    pr_info = {
+        "number": pr["number"],
+        "title": pr["title"],
+        "url": pr["url"],
+        "mergeable": pr["mergeable"],
+        "mergeStateStatus": pr["mergeStateStatus"],
+        "statusCheckRollup": commits[0]["commit"]["statusCheckRollup"] if commits else None,
+    }
+
+    def reviews_page(cursor: str) -> dict:
+        data = _graphql(REVIEWS_PAGE_QUERY,
+                        [*pr_fields, "-f", f"cursor={cursor}"], "PR reviews")
+        return data["repository"]["pullRequest"]["reviews"]
+
+    def review_comments_page(review: dict, cursor: str) -> dict:
+        data = _graphql(REVIEW_COMMENTS_PAGE_QUERY,
+                        ["-f", f"id={review['id']}", "-f", f"cursor={cursor}"], "review comments")
+        return data["node"]["comments"]
+
+    def issue_comments_page(cursor: str) -> dict:
+        data = _graphql(ISSUE_COMMENTS_PAGE_QUERY,
+                        [*pr_fields, "-f", f"cursor={cursor}"], "PR comments")
+        return data["repository"]["pullRequest"]["comments"]
+
+    review_comments = [_rest_comment(node)
+                       for review in _all_nodes(pr["reviews"], reviews_page)
+                       for node in _all_nodes(review["comments"],
+                                              functools.partial(review_comments_page, review))]
+    issue_comments = [_rest_comment(node)
+                      for node in _all_nodes(pr["comments"], issue_comments_page)]
+    bundle = _PR_BUNDLES[pr_number] = (pr_info, review_comments, issue_comments)
+    return bundle
 
 
 def auto_detect_pr_number() -> str:
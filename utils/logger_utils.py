@@ -4,66 +4,107 @@
 
 import os
 import sys
-from datetime import datetime
+import time
+import traceback
+
+
+# Timestamps are formatted down to the second once per second; each call only
+# adds the milliseconds. [whole epoch second, "YYYY-mm-dd HH:MM:SS"]
+_ts_cache = [-1, ""]
+
+
+def _timestamp() -> str:
+    """Current local time as 'YYYY-mm-dd HH:MM:SS.mmm'."""
+    ms = int(time.time() * 1000)
+    seconds = ms // 1000
+    if seconds != _ts_cache[0]:
+        _ts_cache[0] = seconds
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+    return f"{_ts_cache[1]}.{ms % 1000:03d}"
+
+
+# Using sys.argv[0] as a proxy for the current script. It does not change for
+# the life of the process, so the prefix is derived once.
+_SCRIPT_PREFIX = (os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "SDE").upper().replace(".PY", "")
+
+def _discard(message: str, manager_name: str = None):
+    """Stands in for debug()/info() while DEBUG_MODE is off."""
+
 
 class SdeLogger:
+    # Each record is one `sys.stderr.write` of the whole line. Python's stderr
+    # is line-buffered even when redirected, so that line reaches the fd at
+    # once; an explicit flush is only kept on warning/error, ahead of a
+    # possible crash. stderr is deliberately not wrapped in a larger buffer:
+    # the parent process reads Manager stderr, and held-back debug lines
+    # would be lost or interleave wrongly with tracebacks.
     def __init__(self):
         # DEBUG_MODE is determined once when the logger is instantiated.
         # Scripts should import 'logger' from this module to get this instance.
-        self.DEBUG_MODE = os.environ.get("DEBUG", "false").lower() == "true"
         self.log_prefix_override = None # For testing or special contexts
+        self._prefix_suffixes = {} # (level, manager_name, override) -> " LEVEL (NAME):"
+        self.set_debug(os.environ.get("DEBUG", "false").lower() == "true")
+
+    def set_debug(self, enabled: bool):
+        """Turns debug/info output on or off (use this rather than setting DEBUG_MODE).
+
+        While off, `debug` and `info` are rebound on this instance to a no-op, so
+        a disabled call does no flag check and builds no prefix.
+        """
+        self.DEBUG_MODE = enabled
+        if enabled:
+            # Drop the instance overrides so the class methods are found again.
+            self.__dict__.pop("debug", None)
+            self.__dict__.pop("info", None)
+        else:
+            self.debug = self.info = _discard
 
     def _get_prefix(self, level: str, manager_name: str = None) -> str:
         """Generates a standardized log prefix."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] # Milliseconds
-        prefix_parts = [timestamp, level.upper()]
-        
-        # Attempt to get the calling script's name for more context if manager_name not provided
-        # This can be a bit fragile, so it's a best-effort.
-        actual_prefix = self.log_prefix_override
-        if not actual_prefix:
-            if manager_name:
-                actual_prefix = manager_name.upper()
-            else:
-                try:
-                    # Get the name of the script that called the logger method.
-                    # This involves looking up the call stack, which can be complex.
-                    # A simpler way is for each manager to pass its name.
-                    # For now, let's keep it simple or require manager_name.
-                    # Using sys.argv[0] as a proxy for the current script.
-                    calling_script = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else "SDE"
-                    actual_prefix = calling_script.upper().replace(".PY","")
-
-                except Exception:
-                    actual_prefix = "SDE_LOG" # Fallback
-        
-        prefix_parts.append(f"({actual_prefix})")
-        return " ".join(prefix_parts) + ":"
+        # Everything after the timestamp comes from a small fixed set (level x
+        # name), so each combination is resolved and formatted once. The key is
+        # the raw arguments, so a hit also skips `manager_name.upper()`.
+        key = (level, manager_name, self.log_prefix_override)
+        suffix = self._prefix_suffixes.get(key)
+        if suffix is None:
+            # Use the calling script's name for context if manager_name not provided
+            actual_prefix = self.log_prefix_override
+            if not actual_prefix:
+                actual_prefix = manager_name.upper() if manager_name else _SCRIPT_PREFIX
+            suffix = self._prefix_suffixes[key] = f" {level.upper()} ({actual_prefix}):"
+        return _timestamp() + suffix
 
     def debug(self, message: str, manager_name: str = None):
         """Prints a debug message to stderr if DEBUG_MODE is enabled."""
-        if self.DEBUG_MODE:
-            print(f"{self._get_prefix('debug', manager_name)} {message}", file=sys.stderr)
-            sys.stderr.flush() # Ensure immediate output for debugging
+        # Only reached with DEBUG_MODE on; see set_debug().
+        sys.stderr.write(f"{self._get_prefix('debug', manager_name)} {message}\n")
 
     def info(self, message: str, manager_name: str = None):
         """Prints an informational message to stderr (always prints)."""
         # Info messages are generally always shown, not dependent on DEBUG_MODE,
         # but for this tool, stderr is primarily for debug/errors.
         # Let's make info also conditional on DEBUG for now to keep stderr clean unless debugging.
-        # If truly general info is needed on stderr, this condition can be removed.
-        if self.DEBUG_MODE:
-            print(f"{self._get_prefix('info', manager_name)} {message}", file=sys.stderr)
-            sys.stderr.flush()
+        # If truly general info is needed on stderr, drop `info` from set_debug().
+        sys.stderr.write(f"{self._get_prefix('info', manager_name)} {message}\n")
 
     def warning(self, message: str, manager_name: str = None):
         """Prints a warning message to stderr (always prints)."""
-        print(f"{self._get_prefix('warning', manager_name)} {message}", file=sys.stderr)
+        sys.stderr.write(f"{self._get_prefix('warning', manager_name)} {message}\n")
         sys.stderr.flush()
 
     def error(self, message: str, manager_name: str = None):
         """Prints an error message to stderr (always prints)."""
-        print(f"{self._get_prefix('error', manager_name)} {message}", file=sys.stderr)
+        sys.stderr.write(f"{self._get_prefix('error', manager_name)} {message}\n")
+        sys.stderr.flush()
+
+    def exception(self, message: str, manager_name: str = None):
+        """Prints an error message followed by the traceback being handled (always prints).
+
+        Call from an `except` block. The traceback is streamed to stderr
+        instead of being formatted into a string first.
+        """
+        sys.stderr.write(f"{self._get_prefix('error', manager_name)} {message}\n")
+        traceback.print_exc(file=sys.stderr)
         sys.stderr.flush()
 
     def set_log_prefix_override(self, prefix: str = None):
@@ -87,14 +128,14 @@ if __name__ == "__main__":
 
     # Test with DEBUG explicitly enabled for this block
     print("\n--- Testing with DEBUG explicitly ON for logger instance ---")
-    logger.DEBUG_MODE = True # Force debug mode for this test
+    logger.set_debug(True) # Force debug mode for this test
     logger.set_log_prefix_override("TEST_LOGGER") # Test prefix override
     logger.debug("This is a debug message (should appear).")
     logger.info("This is an info message (should appear).")
     logger.warning("This is a warning message (should appear).")
     logger.error("This is an error message (should appear).")
     logger.set_log_prefix_override() # Clear override
-    logger.DEBUG_MODE = os.environ.get("DEBUG", "false").lower() == "true" # Reset to env
+    logger.set_debug(os.environ.get("DEBUG", "false").lower() == "true") # Reset to env
 
     print("\nTo see debug/info messages above, run with DEBUG=true environment variable:")
     print("  DEBUG=true python3 manager_utils/logger_utils.py")
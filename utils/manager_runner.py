@@ -17,31 +17,90 @@ Design Philosophy:
     find the `utils` package.
 
 Manager Script Contract (assumed by this runner):
-  - Invoked with `python3 <manager_script_path> --process-job`.
+  - Invoked with `<current interpreter> <manager_script_path> --process-job`.
   - Reads a single JSON string (a `DiagnosticJob`) from stdin.
   - Writes a single JSON string (the updated `DiagnosticJob`) to stdout.
   - Exits 0 on success.
   - Exits non-zero on failure (this runner will assert returncode is 0).
   - Can import modules from the project's `utils` package (e.g., `from utils.data_model import ...`)
     due to `PYTHONPATH` adjustment by this runner.
+
+Runner Behavior:
+  - Each job runs in a fresh interpreter (`sys.executable`), so a crashing
+    Manager takes only its own process down and no state leaks between jobs.
+  - The job is passed as UTF-8 JSON bytes on stdin; stdout is validated as
+    bytes without decoding. stderr is logged and included in assertion messages.
+  - A Manager that runs longer than `timeout` seconds is killed
+    (`subprocess.TimeoutExpired`).
+  - The subprocess environment is built once, at import.
 """
 
-import subprocess
+import functools
 import json
 import logging
 import os
-import sys # Often useful in utils, though not strictly required by current functionality
+import sys
+from typing import Optional
 
 # --- Critical Imports: Fail loudly at import time if these are missing ---
 # This assumes manager_runner.py is part of the 'utils' package,
 # and data_model.py is a sibling module within 'utils'.
-from .data_model import DiagnosticJob # If this fails, the whole module is unusable.
+from .data_model import DiagnosticJob, serialize_job # If this fails, the whole module is unusable.
+from .process_runner import run_process
 
 # Standard Python logger. Configuration is expected from the calling environment.
 logger = logging.getLogger(__name__)
 
+# Upper bound for a single Manager run. Miner shells out to pandoc and a full TeX
+# compile, so this is generous; it exists to turn a wedged child into a crash.
+DEFAULT_MANAGER_TIMEOUT_SECONDS = 300.0
+
+
+# --- Add Project Root to PYTHONPATH for the subprocess ---
+# Calculate project root: directory containing the 'utils' directory (parent of this script's dir)
+# Assumes this script (manager_runner.py) is in $PROJECT_ROOT/utils/
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # $PROJECT_ROOT
+
+
+def _build_manager_env() -> dict:
+    """
+    Returns a copy of the current environment with the project root prepended to
+    `PYTHONPATH`, so Manager scripts in (e.g.) managers/ can find the utils/ package.
+    """
+    env = os.environ.copy()
+    if 'PYTHONPATH' in env:
+        env['PYTHONPATH'] = _PROJECT_ROOT + os.pathsep + env['PYTHONPATH']
+    else:
+        env['PYTHONPATH'] = _PROJECT_ROOT
+    return env
+
+
+# Shared, read-only environment for every Manager subprocess.
+_MANAGER_ENV = _build_manager_env()
+# --- End PYTHONPATH modification ---
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_manager_script(manager_script_path: str) -> str:
+    """
+    Checks a Manager script path once and remembers it.
 
-def run_manager(manager_script_path: str, diagnostic_job_model: DiagnosticJob) -> DiagnosticJob:
+    The Coordinator runs the same handful of Manager scripts for every job, so
+    only the first call per path hits the filesystem. Failed checks raise and
+    are therefore never cached.
+    """
+    assert manager_script_path.endswith(".py"), \
+        f"Assertion Failed: Manager script is not a Python file: {manager_script_path}"
+    assert os.path.isfile(manager_script_path), \
+        f"Assertion Failed: Manager script not found or is not a file: {manager_script_path}"
+    return manager_script_path
+
+
+def run_manager(
+    manager_script_path: str,
+    diagnostic_job_model: DiagnosticJob,
+    timeout: Optional[float] = DEFAULT_MANAGER_TIMEOUT_SECONDS
+) -> DiagnosticJob:
     """
     Runs a specified SDE Manager script, relying on assertions for contract checks.
 
@@ -50,71 +109,62 @@ def run_manager(manager_script_path: str, diagnostic_job_model: DiagnosticJob) -
     into an updated `DiagnosticJob`. Crashes via AssertionError or direct Python
     errors if any part of the contract is violated.
 
-    Crucially, this function calculates the project's root directory and prepends it
-    to the `PYTHONPATH` for the executed subprocess. This allows the Manager
+    Crucially, the subprocess runs with the project's root directory prepended
+    to its `PYTHONPATH` (computed once, at import time). This allows the Manager
     scripts (e.g., those in the `managers/` directory) to reliably import modules
     from the project's `utils/` package (e.g., `from utils.data_model import DiagnosticJob`).
 
     Args:
         manager_script_path: Path to the Python Manager script.
         diagnostic_job_model: The Pydantic `DiagnosticJob` model instance.
+        timeout: Seconds to wait for the Manager before killing it. `None` waits forever.
 
     Returns:
         An updated `DiagnosticJob` Pydantic model instance from the Manager.
 
     Raises:
         AssertionError: If any explicitly checked contract/assumption fails.
-        FileNotFoundError: If `python3` or `manager_script_path` is not found by subprocess.
+        FileNotFoundError: If the interpreter or `manager_script_path` is not found by subprocess.
         json.JSONDecodeError: If Manager output is not valid JSON.
         pydantic.ValidationError: If Manager output JSON does not match `DiagnosticJob` model.
+        subprocess.TimeoutExpired: If the Manager runs longer than `timeout` seconds.
         (Other standard Python errors may also propagate directly).
     """
-    assert os.path.isfile(manager_script_path), \
-        f"Assertion Failed: Manager script not found or is not a file: {manager_script_path}"
+    manager_script_path = _resolve_manager_script(manager_script_path)
 
-    command = ["python3", manager_script_path, "--process-job"]
+    command = [sys.executable, manager_script_path, "--process-job"]
 
-    # If model_dump_json fails (e.g., Pydantic error), let it crash.
-    job_json_input = diagnostic_job_model.model_dump_json()
+    # Serialize straight to UTF-8 bytes for stdin.
+    # If serialization fails (e.g., Pydantic error), let it crash.
+    job_json_input = serialize_job(diagnostic_job_model)
 
-    logger.debug(f"Running Manager: {' '.join(command)}")
-    log_input_snippet = job_json_input[:500] + ("..." if len(job_json_input) > 500 else "")
-    logger.debug(f"Input DiagnosticJob JSON (snippet for {manager_script_path}):\n{log_input_snippet}")
-
-    # --- Add Project Root to PYTHONPATH for the subprocess ---
-    # Calculate project root: directory containing the 'utils' directory (parent of this script's dir)
-    # Assumes this script (manager_runner.py) is in $PROJECT_ROOT/utils/
-    current_script_dir = os.path.dirname(os.path.abspath(__file__)) # $PROJECT_ROOT/utils
-    project_root = os.path.dirname(current_script_dir) # $PROJECT_ROOT
-    
-    # Get current environment, make a copy to modify
-    env = os.environ.copy()
-    
-    # Prepend project_root to PYTHONPATH, or set it if it doesn't exist
-    # This allows Manager scripts in (e.g.) managers/ to find the utils/ package
-    if 'PYTHONPATH' in env:
-        env['PYTHONPATH'] = project_root + os.pathsep + env['PYTHONPATH']
-    else:
-        env['PYTHONPATH'] = project_root
-    
-    logger.debug(f"Manager subprocess PYTHONPATH for '{manager_script_path}' will be: {env.get('PYTHONPATH')}")
-    # --- End PYTHONPATH modification ---
+    # Debug snippets slice and decode the payload; only build them if they will be logged.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(f"Running Manager: {' '.join(command)}")
+        log_input_snippet = job_json_input[:500].decode('utf-8', errors='replace') + ("..." if len(job_json_input) > 500 else "")
+        logger.debug(f"Input DiagnosticJob JSON (snippet for {manager_script_path}):\n{log_input_snippet}")
+        logger.debug(f"Manager subprocess PYTHONPATH for '{manager_script_path}' will be: {_MANAGER_ENV['PYTHONPATH']}")
 
-    # If subprocess.run fails at OS level (e.g., python3 not found), let it crash.
-    process = subprocess.run(
+    # If the spawn fails at OS level (e.g., interpreter not found), let it crash.
+    # run_process does not check the return code; we assert it explicitly below.
+    process = run_process(
         command,
-        input=job_json_input.encode('utf-8'),
-        capture_output=True,
-        check=False,  # We will assert the returncode explicitly.
-        env=env       # Pass the modified environment to the subprocess
+        input=job_json_input,
+        env=_MANAGER_ENV,  # Shared environment with the project root on PYTHONPATH
+        timeout=timeout
     )
 
-    stdout_str = process.stdout.decode('utf-8').strip()
+    # Keep stdout as bytes: pydantic parses UTF-8 bytes directly, so decoding the
+    # whole payload to `str` first would only add a second full-size copy. It is
+    # not stripped either: the JSON parser skips surrounding whitespace itself.
+    stdout_bytes = process.stdout
     stderr_str = process.stderr.decode('utf-8').strip()
 
-    logger.debug(f"Manager {manager_script_path} exited with RC: {process.returncode}")
-    if stdout_str:
-        log_output_snippet = stdout_str[:500] + ("..." if len(stdout_str) > 500 else "")
+    if debug_enabled:
+        logger.debug(f"Manager {manager_script_path} exited with RC: {process.returncode}")
+    if debug_enabled and stdout_bytes:
+        log_output_snippet = stdout_bytes[:500].decode('utf-8', errors='replace') + ("..." if len(stdout_bytes) > 500 else "")
         logger.debug(f"Manager {manager_script_path} STDOUT (snippet):\n{log_output_snippet}")
     if stderr_str: # Still log stderr as it's useful for debugging assertion failures.
         logger.info(f"Manager {manager_script_path} STDERR:\n{stderr_str}")
@@ -123,14 +173,15 @@ def run_manager(manager_script_path: str, diagnostic_job_model: DiagnosticJob) -
         f"Assertion Failed: Manager script '{manager_script_path}' crashed or reported an error. " \
         f"RC: {process.returncode}\nStderr:\n{stderr_str}"
 
-    assert stdout_str, \
+    assert stdout_bytes and not stdout_bytes.isspace(), \
         f"Assertion Failed: Manager script '{manager_script_path}' returned empty stdout. " \
         f"Expected a JSON DiagnosticJob string."
 
     # If JSON decoding or Pydantic validation fails, let them crash.
-    updated_job_model = DiagnosticJob.model_validate_json(stdout_str)
+    updated_job_model = DiagnosticJob.model_validate_json(stdout_bytes)
     
-    logger.debug(f"Successfully deserialized and validated DiagnosticJob from {manager_script_path} stdout.")
+    if debug_enabled:
+        logger.debug(f"Successfully deserialized and validated DiagnosticJob from {manager_script_path} stdout.")
     return updated_job_model
 
 # No __main__ block for tests in this version.
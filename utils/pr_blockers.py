@@ -6,94 +6,111 @@ PR Blocker Detection and Resolution
 Handles detection of PR merge blockers and provides resolution instructions.
 """
 
-from typing import Dict, List
+from __future__ import annotations
+
+
+# The standard GitHub merge conflict message. In practice, GitHub shows the
+# specific files with conflicts; until those are fetched this is a constant.
+_MERGE_CONFLICT_MSG = ("This branch has conflicts that must be resolved\n"
+                       "Use the web editor or the command line to resolve conflicts before continuing.\n\n"
+                       "CONTRIBUTING.md\n"
+                       "src/smart_pandoc_debugger/main.py")
+
+# Blocker entry for a conflicting PR, built once from the message above.
+_MERGE_CONFLICT_BLOCKER = f"🚫 **MERGE CONFLICTS**:\n{_MERGE_CONFLICT_MSG}"
 
 
 def get_merge_conflict_details(pr_number: str) -> str:
     """Get the exact GitHub merge conflict message."""
-    try:
-        # For now, return the standard GitHub message format
-        # In practice, GitHub shows specific files with conflicts
-        return ("This branch has conflicts that must be resolved\n"
-                "Use the web editor or the command line to resolve conflicts before continuing.\n\n"
-                "CONTRIBUTING.md\n"
-                "src/smart_pandoc_debugger/main.py")
-    except Exception:
-        return ("This branch has conflicts that must be resolved\n"
-                "Use the web editor or the command line to resolve conflicts before continuing.\n\n"
-                "CONTRIBUTING.md\n"
-                "src/smart_pandoc_debugger/main.py")
-
-
-def check_pr_blockers(pr_info: Dict, pr_number: str) -> List[str]:
+    return _MERGE_CONFLICT_MSG
+
+
+# Blocker entries keyed by the GitHub state that causes them; other states
+# (e.g. CLEAN, SUCCESS) are not blockers.
+_MERGEABLE_BLOCKERS = {
+    "CONFLICTING": _MERGE_CONFLICT_BLOCKER,
+    "UNKNOWN": "⚠️  **MERGE STATUS UNKNOWN**: GitHub is still checking for conflicts",
+}
+_MERGE_STATE_BLOCKERS = {
+    "BLOCKED": "🚫 **MERGE BLOCKED**: PR is blocked by branch protection rules",
+    "BEHIND": "⚠️  **BRANCH BEHIND**: Branch is behind the base branch and needs update",
+    "DRAFT": "📝 **DRAFT PR**: This is a draft PR and cannot be merged yet",
+}
+_CHECK_STATE_BLOCKERS = {
+    "FAILURE": "❌ **FAILING CHECKS**: Some required status checks are failing",
+    "PENDING": "⏳ **PENDING CHECKS**: Status checks are still running",
+    "ERROR": "💥 **CHECK ERRORS**: Some status checks encountered errors",
+}
+
+
+def check_pr_blockers(pr_info: dict, pr_number: str) -> list[str]:
     """Check for PR blockers like merge conflicts, failing checks, etc."""
     blockers = []
 
     # Check for merge conflicts
-    mergeable = pr_info.get("mergeable")
-    if mergeable == "CONFLICTING":
-        # Get the exact GitHub conflict message
-        conflict_details = get_merge_conflict_details(pr_number)
-        blockers.append(f"🚫 **MERGE CONFLICTS**:\n{conflict_details}")
-    elif mergeable == "UNKNOWN":
-        blockers.append(
-            "⚠️  **MERGE STATUS UNKNOWN**: GitHub is still checking for conflicts"
-        )
+    mergeable_msg = _MERGEABLE_BLOCKERS.get(pr_info.get("mergeable"))
+    if mergeable_msg:
+        blockers.append(mergeable_msg)
 
     # Check merge state status
-    merge_state = pr_info.get("mergeStateStatus")
-    if merge_state == "BLOCKED":
-        blockers.append(
-            "🚫 **MERGE BLOCKED**: PR is blocked by branch protection rules"
-        )
-    elif merge_state == "BEHIND":
-        blockers.append(
-            "⚠️  **BRANCH BEHIND**: Branch is behind the base branch and needs update"
-        )
-    elif merge_state == "DRAFT":
-        blockers.append("📝 **DRAFT PR**: This is a draft PR and cannot be merged yet")
+    merge_state_msg = _MERGE_STATE_BLOCKERS.get(pr_info.get("mergeStateStatus"))
+    if merge_state_msg:
+        blockers.append(merge_state_msg)
 
     # Check status checks
     status_rollup = pr_info.get("statusCheckRollup")
     if status_rollup:
-        state = status_rollup.get("state")
-        if state == "FAILURE":
-            blockers.append("❌ **FAILING CHECKS**: Some required status checks are failing")
-        elif state == "PENDING":
-            blockers.append("⏳ **PENDING CHECKS**: Status checks are still running")
-        elif state == "ERROR":
-            blockers.append("💥 **CHECK ERRORS**: Some status checks encountered errors")
+        check_state_msg = _CHECK_STATE_BLOCKERS.get(status_rollup.get("state"))
+        if check_state_msg:
+            blockers.append(check_state_msg)
 
     return blockers
 
 
-def print_blocker_instructions(blockers: List[str]):
+# Resolution steps per blocker kind, keyed by the marker in the blocker text
+# and printed in this order.
+_BLOCKER_SOLUTIONS = {
+    "MERGE CONFLICTS": [
+        "\n**For Merge Conflicts:**",
+        "   1. Update your branch: `git fetch origin && git merge origin/main`",
+        "   2. Resolve conflicts in your editor",
+        "   3. Commit the resolution: `git commit`",
+        "   4. Push the changes: `git push`",
+    ],
+    "BRANCH BEHIND": [
+        "\n**For Branch Behind:**",
+        "   1. Update your branch: `git fetch origin && git merge origin/main`",
+        "   2. Push the updates: `git push`",
+    ],
+    "FAILING CHECKS": [
+        "\n**For Failing Checks:**",
+        "   1. Check the 'Checks' tab in the PR to see which tests failed",
+        "   2. Fix the failing tests or code issues",
+        "   3. Commit and push your fixes",
+    ],
+}
+
+
+def print_blocker_instructions(blockers: list[str]):
     """Print instructions for resolving PR blockers."""
-    print("\n" + "=" * 80)
-    print("🚨 PR BLOCKED: Issues Must Be Resolved Before Merge")
-    print("=" * 80)
-
+    # The report is assembled first and written with a single print
+    out = [
+        "\n" + "=" * 80,
+        "🚨 PR BLOCKED: Issues Must Be Resolved Before Merge",
+        "=" * 80,
+    ]
+
+    # One pass over the blockers: list each and note which kinds are present
+    present = set()
     for i, blocker in enumerate(blockers, 1):
-        print(f"\n{i}. {blocker}")
-
-    print("\n🔧 **Common Solutions:**")
-
-    if any("MERGE CONFLICTS" in blocker for blocker in blockers):
-        print("\n**For Merge Conflicts:**")
-        print("   1. Update your branch: `git fetch origin && git merge origin/main`")
-        print("   2. Resolve conflicts in your editor")
-        print("   3. Commit the resolution: `git commit`")
-        print("   4. Push the changes: `git push`")
+        out.append(f"\n{i}. {blocker}")
+        present.update(marker for marker in _BLOCKER_SOLUTIONS if marker in blocker)
 
-    if any("BRANCH BEHIND" in blocker for blocker in blockers):
-        print("\n**For Branch Behind:**")
-        print("   1. Update your branch: `git fetch origin && git merge origin/main`")
-        print("   2. Push the updates: `git push`")
+    out.append("\n🔧 **Common Solutions:**")
 
-    if any("FAILING CHECKS" in blocker for blocker in blockers):
-        print("\n**For Failing Checks:**")
-        print("   1. Check the 'Checks' tab in the PR to see which tests failed")
-        print("   2. Fix the failing tests or code issues")
-        print("   3. Commit and push your fixes")
+    for marker, solution_lines in _BLOCKER_SOLUTIONS.items():
+        if marker in present:
+            out.extend(solution_lines)
 
-    print("\n⚠️  **Once all blockers are resolved, the PR will be ready for merge!**")
+    out.append("\n⚠️  **Once all blockers are resolved, the PR will be ready for merge!**")
+    print("\n".join(out))
@@ -10,24 +10,27 @@ Usage:
     python utils/pr_response_helper.py [PR_NUMBER]
 
 The script will:
-1. Fetch all review comments from the PR
+1. Fetch the PR and all of its review comments (one GraphQL request)
 2. Generate a comprehensive backlink response template
 3. Show the exact GitHub CLI command to post the response
 
 Author: Smart Pandoc Debugger Team
 """
 
+from __future__ import annotations
+
 import argparse
+import re
+import shlex
 import subprocess
 import sys
-from typing import Dict, List, Optional
+from operator import itemgetter
 
-from gh_api_client import (auto_detect_pr_number, get_issue_comments,
-                           get_pr_info, get_review_comments)
+from gh_api_client import auto_detect_pr_number, fetch_pr_bundle
 from pr_blockers import check_pr_blockers, print_blocker_instructions
 
 
-def extract_comment_info(comment: Dict, comment_type: str) -> Dict:
+def extract_comment_info(comment: dict, comment_type: str) -> dict:
     """Extract relevant information from a comment."""
     info = {
         "id": comment["id"],
@@ -46,64 +49,83 @@ def extract_comment_info(comment: Dict, comment_type: str) -> Dict:
     return info
 
 
-def is_from_bot(comment: Dict) -> bool:
-    """Check if comment is from a bot or automation."""
-    user = comment.get("user", {})
-    login = user.get("login", "").lower()
+# Login substrings that mark automation accounts, matched in one scan.
+_BOT_LOGIN_PATTERN = re.compile(r"bot|codepilot|github-actions|dependabot", re.IGNORECASE)
 
-    bot_indicators = ["bot", "codepilot", "github-actions", "dependabot"]
-    return any(indicator in login for indicator in bot_indicators)
 
-
-def format_comment_for_response(comment_info: Dict, index: int) -> str:
+def is_from_bot(comment: dict) -> bool:
+    """Check if comment is from a bot or automation."""
+    user = comment.get("user", {})
+    # GitHub marks app and bot accounts explicitly; only fall back to the login otherwise.
+    if user.get("type") == "Bot":
+        return True
+    return _BOT_LOGIN_PATTERN.search(user.get("login", "")) is not None
+
+
+# The response template is plain string assembly over comment dicts: each
+# comment is one f-string and the template is one join, never `+=`. JIT
+# compilers (Numba/Cython) are a non-goal here; Numba's nopython mode cannot
+# handle heterogeneous dicts or f-strings, and object mode gives no speedup.
+_HEADER = "## 🔗 Response to Reviewer Comments\n\n"
+_FOOTER = "\n".join([
+    "",
+    "",
+    "---",
+    "",
+    "🔧 **Action Plan:**",
+    "1. Address each concern in code",
+    "2. Update this comment with commit hashes and solutions",
+    "3. Request conversation resolution",
+    "",
+    "Ready for resolution! Click the links above to resolve each conversation ✅"
+])
+
+
+# Stand-in comment for `--show-template-only`, which fetches nothing.
+_PLACEHOLDER_COMMENT = {
+    "id": "[COMMENT_ID]",
+    "html_url": "[COMMENT_URL]",
+    "body": "[Reviewer comment]",
+    "user": "[AUTHOR]",
+    "created_at": "",
+    "type": "review",
+}
+
+
+def format_comment_for_response(comment_info: dict, index: int) -> str:
     """Format a single comment for the response template."""
-    html_url = comment_info["html_url"]
     body = comment_info["body"]
     body_preview = body[:100] + "..." if len(body) > 100 else body
 
-    response_section = f"### {index}. [📝 Resolve Comment #{comment_info['id']}]({html_url})"
-    response_section += f"\n**Author**: {comment_info['user']}"
-
-    if comment_info.get("path"):
-        response_section += f"\n**File**: {comment_info['path']}"
-        if comment_info.get("line"):
-            response_section += f" (line {comment_info['line']})"
-
-    response_section += f"\n**Link**: {html_url}"
-    response_section += f"\n**Comment**: {body_preview}"
-    response_section += "\n**Status**: ⏳ Reviewing..."
-    response_section += "\n**Solution**: [To be filled in after fixing]"
+    path = comment_info.get("path")
+    line = comment_info.get("line")
+    if path and line:
+        path_suffix = f" - `{path}:{line}`"
+    elif path:
+        path_suffix = f" - `{path}`"
+    else:
+        path_suffix = ""
 
-    return response_section
+    return (f"### ✅ Comment {index}: {comment_info['user']} ({comment_info['type']}){path_suffix}\n"
+            f"**Link**: {comment_info['html_url']}\n"
+            f"**Comment**: {body_preview}\n"
+            "**Status**: ⏳ Reviewing...\n"
+            "**Solution**: [To be filled in after fixing]")
 
 
-def generate_response_template(pr_number: str, comments: List[Dict]) -> Optional[str]:
+def generate_response_template(pr_number: str, comments: list[dict]) -> str | None:
     """Generate the comprehensive backlink response template."""
     if not comments:
         return None
 
-    # Sort comments by creation date
-    comments.sort(key=lambda x: x["created_at"])
+    # Sort comments by creation date. Each stream already arrives in creation
+    # order from GitHub, so this timsort is a near-linear merge of two runs.
+    comments.sort(key=itemgetter("created_at"))
 
-    # Generate the response template
-    response_parts = ["## 🔗 Response to Reviewer Comments\n"]
-
-    for i, comment in enumerate(comments, 1):
-        response_parts.append(format_comment_for_response(comment, i))
-        response_parts.append("")  # Empty line between comments
-
-    response_parts.extend([
-        "---",
-        "",
-        "🔧 **Action Plan:**",
-        "1. Address each concern in code",
-        "2. Update this comment with commit hashes and solutions",
-        "3. Request conversation resolution",
-        "",
-        "Ready for resolution! Click the links above to resolve each conversation ✅"
-    ])
-
-    return "\n".join(response_parts)
+    # Comments are separated by an empty line
+    sections = "\n\n".join(format_comment_for_response(comment, i)
+                            for i, comment in enumerate(comments, 1))
+    return "".join([_HEADER, sections, _FOOTER])
 
 
 def get_latest_commit_hash() -> str:
@@ -138,11 +160,12 @@ def print_instructions(pr_number: str, response_template: str):
     print("   Use this EXACT command (copy and paste):")
     print("\n" + "-" * 40)
 
-    # Escape quotes in the response template for the shell command
-    escaped_template = response_template.replace('"', '\\"').replace('`', '\\`')
+    # Single-quote the template for the shell: one pass, and `$`, `\` and
+    # backticks in comment bodies are all left literal.
+    quoted_template = shlex.quote(response_template)
 
     print(
-        f'GH_PAGER=cat GH_PROMPT_DISABLED=1 gh pr comment {pr_number} --body "{escaped_template}"')
+        f'GH_PAGER=cat GH_PROMPT_DISABLED=1 gh pr comment {pr_number} --body {quoted_template}')
     print("-" * 40)
 
     print("\n📝 STEP 4: Update Response After Fixing")
@@ -196,6 +219,11 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.show_template_only:
+        # No gh calls at all, not even PR auto-detection
+        print(generate_response_template(args.pr_number or "[PR_NUMBER]", [_PLACEHOLDER_COMMENT]))
+        return
+
     # Auto-detect PR number if not provided
     pr_number = args.pr_number
     if not pr_number:
@@ -209,8 +237,8 @@ Examples:
     print(f"🚀 Starting PR response helper for PR #{pr_number}")
     print("=" * 60)
 
-    # Fetch PR info
-    pr_info = get_pr_info(pr_number)
+    # Fetch PR info and all comments in one request
+    pr_info, review_comments, issue_comments = fetch_pr_bundle(pr_number)
     print(f"📄 PR Title: {pr_info['title']}")
     print(f"🔗 PR URL: {pr_info['url']}")
 
@@ -220,22 +248,14 @@ Examples:
         print_blocker_instructions(blockers)
         return
 
-    # Fetch all comments
-    review_comments = get_review_comments(pr_number)
-    issue_comments = get_issue_comments(pr_number)
-
-    # Process and filter comments
-    all_comments = []
-
-    # Add review comments (line-specific)
-    for comment in review_comments:
-        if is_from_bot(comment):
-            all_comments.append(extract_comment_info(comment, "review"))
-
-    # Add issue comments (general PR comments)
-    for comment in issue_comments:
-        if is_from_bot(comment):
-            all_comments.append(extract_comment_info(comment, "issue"))
+    # Keep bot comments from both streams: review comments (line-specific)
+    # and issue comments (general PR comments)
+    all_comments = [
+        extract_comment_info(comment, comment_type)
+        for comment_type, comments in (("review", review_comments), ("issue", issue_comments))
+        for comment in comments
+        if is_from_bot(comment)
+    ]
 
     print(f"💬 Found {len(all_comments)} bot comments to address")
 
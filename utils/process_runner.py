@@ -59,6 +59,65 @@ except Exception as e:
     PROJECT_ROOT_PATH = None
 
 
+def _with_project_root(pythonpath: Optional[str]) -> str:
+    """Returns `pythonpath` with the project root prepended."""
+    project_root_str = str(PROJECT_ROOT_PATH)
+    if pythonpath is None:
+        return project_root_str
+    return project_root_str + os.pathsep + pythonpath
+
+
+# --- Subprocess Environments ---
+# Copied from os.environ at import; run_script never mutates these.
+_PLAIN_ENV: Dict[str, str] = dict(os.environ)
+_PROJECT_ENV: Optional[Dict[str, str]] = (
+    {**_PLAIN_ENV, "PYTHONPATH": _with_project_root(_PLAIN_ENV.get("PYTHONPATH"))}
+    if PROJECT_ROOT_PATH else None
+)
+
+
+def run_process(
+    command_parts: List[str],
+    *,
+    input: Optional[bytes] = None,
+    env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None
+) -> subprocess.CompletedProcess:
+    """
+    Runs a command in binary mode and returns the `CompletedProcess` unchecked.
+
+    This is the single subprocess seam used by `utils.manager_runner.run_manager`:
+    callers own contract checks (return code, stdout content), and tests mock this
+    function instead of `subprocess.run` itself.
+
+    Spawn cost: on Linux with Python 3.10+, `subprocess` launches children via
+    `vfork()` (no page-table copy of the parent) as long as no `preexec_fn`,
+    user/group switch or similar option is passed. Keep this call free of those
+    options; a hand-rolled `os.posix_spawn` path would not be faster.
+
+    Args:
+        command_parts: List of strings forming the command and its arguments.
+        input: Optional bytes passed to the process's stdin.
+        env: Optional full environment for the process (inherits ours if None).
+        timeout: Optional timeout in seconds for the subprocess.
+
+    Returns:
+        The `subprocess.CompletedProcess`, with `stdout`/`stderr` as bytes.
+
+    Raises:
+        FileNotFoundError: If the command in `command_parts` is not found.
+        subprocess.TimeoutExpired: If the timeout is reached.
+    """
+    return subprocess.run(
+        command_parts,
+        input=input,
+        capture_output=True,
+        check=False,
+        env=env,
+        timeout=timeout
+    )
+
+
 def run_script(
     command_parts: List[str],
     input_json_obj: Optional[dict] = None,
@@ -117,19 +176,18 @@ def run_script(
     if input_json_obj is not None:
         input_str_for_subprocess = json.dumps(input_json_obj)
 
-    effective_env = os.environ.copy()
-    if env_additions:
-        effective_env.update(env_additions)
-
     if set_project_pythonpath and PROJECT_ROOT_PATH:
-        project_root_str = str(PROJECT_ROOT_PATH)
-        if "PYTHONPATH" in effective_env:
-            effective_env["PYTHONPATH"] = project_root_str + os.pathsep + effective_env["PYTHONPATH"]
+        if env_additions and "PYTHONPATH" in env_additions:
+            # The caller's PYTHONPATH still gets the project root in front of it.
+            effective_env = {**_PLAIN_ENV, **env_additions,
+                             "PYTHONPATH": _with_project_root(env_additions["PYTHONPATH"])}
         else:
-            effective_env["PYTHONPATH"] = project_root_str
+            effective_env = {**_PROJECT_ENV, **env_additions} if env_additions else _PROJECT_ENV
         logger.debug(f"[{caller_name}] Setting PYTHONPATH for '{command_parts[0]}' to: {effective_env['PYTHONPATH']}")
-    elif set_project_pythonpath and not PROJECT_ROOT_PATH:
-        logger.warning(f"[{caller_name}] Wanted to set project PYTHONPATH for '{command_parts[0]}' but project root could not be determined.")
+    else:
+        effective_env = {**_PLAIN_ENV, **env_additions} if env_additions else _PLAIN_ENV
+        if set_project_pythonpath:
+            logger.warning(f"[{caller_name}] Wanted to set project PYTHONPATH for '{command_parts[0]}' but project root could not be determined.")
 
 
     logger.debug(f"[{caller_name}] Running command: {' '.join(command_parts)}")
@@ -137,6 +195,8 @@ def run_script(
         logger.debug(f"[{caller_name}]   Input JSON (first 100 chars): {input_str_for_subprocess[:100]}"
                      f"{'...' if len(input_str_for_subprocess) > 100 else ''}")
 
+    # Like run_process: no preexec_fn or user/group options, so CPython keeps its
+    # vfork() spawn path (see the note in run_process's docstring).
     proc = subprocess.run(
         command_parts,
         input=input_str_for_subprocess,